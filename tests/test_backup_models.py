@@ -0,0 +1,87 @@
+"""
+Tests for backup manifest serialization.
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from vapi_manager.core.backup_models import (
+    AssistantBackupData,
+    BackupManifest,
+    BackupMetadata,
+    BackupScope,
+    BackupType
+)
+
+
+@pytest.fixture
+def manifest():
+    """Manifest whose assistants share one prompt and each have a short and a unique file."""
+    shared_prompt = "You are a helpful assistant for the dental clinic.\n" * 4
+    assistants = [
+        AssistantBackupData(
+            assistant_name=name,
+            file_contents={
+                "prompts/system.md": shared_prompt,
+                "assistant.yaml": f"name: {name}\n",
+                "prompts/notes.md": f"Notes that only {name} has.\n" * 8
+            }
+        )
+        for name in ("triage", "scheduler")
+    ]
+    metadata = BackupMetadata(
+        backup_id="backup_test",
+        created_at=datetime(2025, 1, 25, 10, 0, tzinfo=timezone.utc),
+        created_by="tester",
+        backup_type=BackupType.CONFIG_ONLY,
+        backup_scope=BackupScope.MULTIPLE,
+        environment="development",
+        assistant_count=len(assistants),
+        total_size_bytes=0
+    )
+    manifest = BackupManifest(metadata=metadata, assistants=assistants)
+    manifest.checksum = manifest.calculate_checksum()
+    return manifest
+
+
+class TestBackupManifestSerialization:
+    """Test shared file contents round-trip through the manifest format."""
+
+    def test_round_trip_with_shared_contents(self, manifest):
+        """Test shared contents become blobs and are restored on load."""
+        data = manifest.to_dict()
+
+        assert data["backup_format_version"] == "1.1"
+        assert len(data["blobs"]) == 1
+        key, content = next(iter(data["blobs"].items()))
+        assert len(key) == 64
+        for assistant in data["assistants"]:
+            files = assistant["file_contents"]
+            assert files["prompts/system.md"] == {"blob": key}
+            assert isinstance(files["assistant.yaml"], str)
+            assert isinstance(files["prompts/notes.md"], str)
+
+        loaded = BackupManifest.from_dict(data)
+
+        assert loaded.backup_format_version == "1.0"
+        assert [a.file_contents for a in loaded.assistants] == [a.file_contents for a in manifest.assistants]
+        assert loaded.validate_integrity()
+
+    def test_inline_manifest_stays_version_1_0(self, manifest):
+        """Test a manifest without repeated contents is written inline as 1.0."""
+        manifest.assistants = manifest.assistants[:1]
+        manifest.checksum = manifest.calculate_checksum()
+
+        data = manifest.to_dict()
+
+        assert data["backup_format_version"] == "1.0"
+        assert "blobs" not in data
+        assert BackupManifest.from_dict(data).validate_integrity()
+
+    def test_unknown_format_version_rejected(self, manifest):
+        """Test manifests from an unknown format version are not loaded."""
+        data = manifest.to_dict()
+        data["backup_format_version"] = "2.0"
+
+        with pytest.raises(ValueError, match="Unsupported backup format version"):
+            BackupManifest.from_dict(data)
@@ -473,6 +473,53 @@ class TestBootstrapManagerPhase2:
         assert result["assistants"] == 2
         assert result["tools"] == 1
 
+    def test_create_assistants_records_before_tool_failure(self, temp_directories):
+        """Test an assistant is checkpointed even if adding its tools fails."""
+        manager = BootstrapManager(
+            assistants_dir=temp_directories["assistants"],
+            squads_dir=temp_directories["squads"],
+            templates_dir=temp_directories["templates"],
+            shared_tools_dir=temp_directories["shared_tools"]
+        )
+        checkpoint = BootstrapCheckpoint()
+        assistants = [BootstrapAssistant(name="triage", template="vapi_triage", required_tools=["lookup"])]
+
+        with patch.object(manager.template_manager, 'init_assistant', return_value=True), \
+             patch.object(manager, '_add_tools_to_assistant', side_effect=RuntimeError("tools failed")):
+            with pytest.raises(BootstrapExecutionError, match="tools failed"):
+                manager._create_assistants(assistants, checkpoint, force=False)
+
+        assert checkpoint.created_assistants == ["triage"]
+        assert "assistant_triage" in checkpoint.completed_steps
+
+    def test_load_manifest_uses_cache(self, temp_directories, sample_manifest):
+        """Test unchanged manifests are parsed only once."""
+        manager = BootstrapManager(
+            assistants_dir=temp_directories["assistants"],
+            squads_dir=temp_directories["squads"],
+            templates_dir=temp_directories["templates"],
+            shared_tools_dir=temp_directories["shared_tools"]
+        )
+
+        manifest_file = Path(temp_directories["templates"]) / "squads" / "manifest.yaml"
+        with open(manifest_file, 'w') as f:
+            yaml.dump(sample_manifest, f)
+
+        first = manager._load_manifest(manifest_file)
+        assert manager._load_manifest(manifest_file) is first
+
+        # Rewriting the file changes its size, so it is parsed again
+        sample_manifest["description"] = "Updated dental clinic squad"
+        with open(manifest_file, 'w') as f:
+            yaml.dump(sample_manifest, f)
+
+        second = manager._load_manifest(manifest_file)
+        assert second is not first
+        assert second.description == "Updated dental clinic squad"
+
+        manager.invalidate_manifest_cache()
+        assert manager._load_manifest(manifest_file) is not second
+
     @patch('vapi_manager.core.bootstrap_manager.console')
     def test_rollback_bootstrap(self, mock_console, temp_directories):
         """Test rollback functionality."""
@@ -626,6 +673,43 @@ class TestBootstrapManagerPhase3:
         assert result["strategy"] == "blue_green"
         assert result["overall_success"] is True
 
+    @pytest.mark.asyncio
+    async def test_deploy_pipeline_all_at_once_aborts_on_failure(self, temp_directories):
+        """Test all-at-once pipeline stops at the first failed environment."""
+        manager = BootstrapManager(
+            assistants_dir=temp_directories["assistants"],
+            squads_dir=temp_directories["squads"],
+            templates_dir=temp_directories["templates"],
+            shared_tools_dir=temp_directories["shared_tools"]
+        )
+
+        squad_dir = Path(temp_directories["squads"]) / "test_squad"
+        squad_dir.mkdir()
+
+        with patch.object(manager, 'health_check_squad', AsyncMock(return_value=False)):
+            result = await manager.deploy_pipeline(
+                squad_name="test_squad",
+                environments=["development", "staging", "production"],
+                strategy=BootstrapStrategy.ALL_AT_ONCE,
+                approval_required=False
+            )
+
+        assert [stage["environment"] for stage in result["stages"]] == ["development"]
+        assert result["overall_success"] is False
+
+    @pytest.mark.asyncio
+    async def test_execute_deployment_strategy_rejects_unknown(self, temp_directories):
+        """Test an unmapped strategy raises instead of falling back."""
+        manager = BootstrapManager(
+            assistants_dir=temp_directories["assistants"],
+            squads_dir=temp_directories["squads"],
+            templates_dir=temp_directories["templates"],
+            shared_tools_dir=temp_directories["shared_tools"]
+        )
+
+        with pytest.raises(ValueError, match="Unsupported deployment strategy"):
+            await manager._execute_deployment_strategy("test_squad", "development", "canary")
+
     @pytest.mark.asyncio
     async def test_health_check_squad(self, temp_directories):
         """Test squad health check functionality."""
@@ -658,6 +742,26 @@ class TestBootstrapManagerPhase3:
 
         assert health_status is False
 
+    @pytest.mark.asyncio
+    async def test_health_check_squad_without_members(self, temp_directories):
+        """Test that a squad with no members skips its health checks."""
+        manager = BootstrapManager(
+            assistants_dir=temp_directories["assistants"],
+            squads_dir=temp_directories["squads"],
+            templates_dir=temp_directories["templates"],
+            shared_tools_dir=temp_directories["shared_tools"]
+        )
+
+        squad_dir = Path(temp_directories["squads"]) / "empty_squad"
+        squad_dir.mkdir()
+        (squad_dir / "members.yaml").write_text("members: []\n")
+
+        # Checks would fail if they ran
+        with patch('random.random', return_value=0.05):
+            health_status = await manager.health_check_squad("empty_squad", "development")
+
+        assert health_status is True
+
     def test_get_deployment_status(self, temp_directories):
         """Test getting deployment status."""
         manager = BootstrapManager(
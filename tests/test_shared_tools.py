@@ -76,6 +76,25 @@ class TestSharedTools(unittest.TestCase):
         self.assertEqual(result["items"], [1, 2, 3, 4, 5])
         self.assertEqual(result["tags"], ["foo", "bar", "baz"])
 
+    def test_deep_merge_lists_deduplicates_base(self):
+        """Test duplicates already in the base list are removed too."""
+        base = {"tags": ["foo", "bar", "foo"]}
+        override = {"tags": ["baz", "bar"]}
+
+        result = self.loader._deep_merge(base, override)
+
+        self.assertEqual(result["tags"], ["foo", "bar", "baz"])
+        self.assertEqual(base["tags"], ["foo", "bar", "foo"])
+
+    def test_deep_merge_lists_deduplicates_any_hashable(self):
+        """Test every hashable item is deduplicated, unhashable ones kept."""
+        base = {"items": [None, b"x", frozenset({1}), {"a": 1}]}
+        override = {"items": [None, b"x", frozenset({1}), {"a": 1}]}
+
+        result = self.loader._deep_merge(base, override)
+
+        self.assertEqual(result["items"], [None, b"x", frozenset({1}), {"a": 1}, {"a": 1}])
+
     def test_resolve_simple_reference(self):
         """Test resolving a simple tool reference."""
         # Create a base tool file
@@ -281,6 +300,48 @@ class TestSharedTools(unittest.TestCase):
         self.assertEqual(result["functions"]["functions"][0]["name"], "queryKnowledgeBase")
         self.assertEqual(result["functions"]["functions"][1]["name"], "localTool")
 
+    def test_load_events_js_and_py(self):
+        """Test that event scripts with .js and .py suffixes are loaded."""
+        events_dir = self.project_root / "assistants" / "test" / "events"
+        events_dir.mkdir(parents=True, exist_ok=True)
+
+        (events_dir / "on_start.js").write_text("console.log('start');")
+        (events_dir / "on_end.py").write_text("print('end')")
+        (events_dir / "notes.txt").write_text("ignored")
+
+        result = self.loader._load_events(events_dir)
+
+        self.assertEqual(set(result), {"on_start", "on_end"})
+        self.assertEqual(result["on_end"], "print('end')")
+
+
+    def test_json_schema_wins_over_yaml_with_same_stem(self):
+        """Test JSON files take precedence over YAML files sharing a stem."""
+        schemas_dir = self.project_root / "assistants" / "test" / "schemas"
+        schemas_dir.mkdir(parents=True, exist_ok=True)
+
+        (schemas_dir / "a.yaml").write_text("source: yaml\n")
+        (schemas_dir / "a.yml").write_text("source: yml\n")
+        (schemas_dir / "a.json").write_text('{"source": "json"}')
+        (schemas_dir / "b.yml").write_text("source: yml\n")
+        (schemas_dir / "b.yaml").write_text("source: yaml\n")
+
+        result = self.loader._load_schemas(schemas_dir)
+
+        self.assertEqual(result, {"a": {"source": "json"}, "b": {"source": "yml"}})
+
+    def test_unreadable_system_prompt_raises(self):
+        """Test a system prompt that cannot be decoded fails the load."""
+        assistants_dir = self.project_root / "assistants"
+        prompts_dir = assistants_dir / "broken" / "prompts"
+        prompts_dir.mkdir(parents=True, exist_ok=True)
+        (assistants_dir / "broken" / "assistant.yaml").write_text("name: broken\n")
+        (prompts_dir / "system.md").write_bytes(b"\xff\xfe not utf-8")
+
+        loader = AssistantConfigLoader(str(assistants_dir))
+
+        with self.assertRaises(UnicodeDecodeError):
+            loader.load_assistant("broken")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
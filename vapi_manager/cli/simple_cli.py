@@ -1313,7 +1313,8 @@ async def backup_assistants(
     backup_type="full",
     description=None,
     tags=None,
-    directory="assistants"
+    directory="assistants",
+    compress=False
 ):
     """Create a backup of assistants."""
     console.print(f"[cyan]Creating backup...[/cyan]")
@@ -1327,7 +1328,7 @@ async def backup_assistants(
 
     try:
         # Create backup manager
-        backup_manager = BackupManager(directory)
+        backup_manager = BackupManager(directory, compress=compress)
 
         # Convert backup type string to enum
         backup_type_enum = BackupType(backup_type)
@@ -1347,7 +1348,7 @@ async def backup_assistants(
         # Display results
         console.print(f"\n[green]+ Backup created successfully![/green]")
         console.print(f"[cyan]Backup ID:[/cyan] {manifest.metadata.backup_id}")
-        console.print(f"[cyan]File:[/cyan] backups/{manifest.metadata.backup_id}.json")
+        console.print(f"[cyan]File:[/cyan] {backup_manager.get_backup_path(manifest.metadata.backup_id)}")
         console.print(f"[cyan]Assistants backed up:[/cyan] {manifest.metadata.assistant_count}")
         console.print(f"[cyan]Total size:[/cyan] {BackupUtils.format_file_size(manifest.metadata.total_size_bytes)}")
         console.print(f"[cyan]Created at:[/cyan] {manifest.metadata.created_at}")
@@ -1488,7 +1489,7 @@ async def restore_backup(
         raise
 
 
-def list_backups(directory="assistants"):
+def list_backups(directory="assistants", deep=False):
     """List all available backups."""
     try:
         backup_manager = BackupManager(directory)
@@ -1514,8 +1515,8 @@ def list_backups(directory="assistants"):
             created_date = backup.created_at.strftime("%Y-%m-%d %H:%M")
 
             # Get file size
-            backup_file = backup_manager.backups_dir / f"{backup.backup_id}.json"
-            if backup_file.exists():
+            backup_file = backup_manager.get_backup_path(backup.backup_id)
+            if backup_file is not None:
                 size = BackupUtils.format_file_size(backup_file.stat().st_size)
             else:
                 size = "N/A"
@@ -1538,7 +1539,7 @@ def list_backups(directory="assistants"):
         console.print(table)
 
         # Display backup health summary
-        report = BackupUtils.generate_backup_report(backup_manager)
+        report = BackupUtils.generate_backup_report(backup_manager, deep=deep)
         console.print(f"\n[cyan]Total backups:[/cyan] {report['total_backups']}")
         console.print(f"[cyan]Total size:[/cyan] {report['total_size_formatted']}")
         console.print(f"[cyan]Health status:[/cyan] {report['backup_health']}")
@@ -2691,6 +2692,7 @@ def main():
     assistant_backup_parser.add_argument("--description", help="Backup description")
     assistant_backup_parser.add_argument("--tags", help="Comma-separated tags for the backup")
     assistant_backup_parser.add_argument("--dir", default="assistants", help="Directory containing assistants")
+    assistant_backup_parser.add_argument("--compress", action="store_true", help="Compress the backup file (zstd, or gzip if zstandard is not installed)")
 
     assistant_restore_parser = assistant_subparsers.add_parser("restore", help="Restore assistants from a backup")
     assistant_restore_parser.add_argument("backup_path", help="Path to backup file")
@@ -2964,6 +2966,7 @@ def main():
     file_backup_parser.add_argument("--description", help="Backup description")
     file_backup_parser.add_argument("--tags", help="Comma-separated tags for the backup")
     file_backup_parser.add_argument("--dir", default="assistants", help="Directory containing assistants")
+    file_backup_parser.add_argument("--compress", action="store_true", help="Compress the backup file (zstd, or gzip if zstandard is not installed)")
 
     file_restore_parser = file_subparsers.add_parser("restore", help="Restore assistants from a backup")
     file_restore_parser.add_argument("backup_path", help="Path to backup file")
@@ -2976,6 +2979,7 @@ def main():
 
     file_backups_parser = file_subparsers.add_parser("backups", help="List available backups")
     file_backups_parser.add_argument("--dir", default="assistants", help="Directory containing assistants")
+    file_backups_parser.add_argument("--deep", action="store_true", help="Verify every backup's checksum for the health summary")
 
     file_backup_info_parser = file_subparsers.add_parser("backup-info", help="Show detailed backup information")
     file_backup_info_parser.add_argument("backup_id", help="Backup ID to show details for")
@@ -3046,7 +3050,8 @@ def main():
                     args.type,
                     args.description,
                     args.tags,
-                    args.dir
+                    args.dir,
+                    args.compress
                 ))
             elif args.assistant_command == "restore":
                 # Parse restore options
@@ -3237,7 +3242,8 @@ def main():
                     args.type,
                     args.description,
                     args.tags,
-                    args.dir
+                    args.dir,
+                    args.compress
                 ))
             elif args.file_command == "restore":
                 # Parse restore options
@@ -3254,7 +3260,7 @@ def main():
                     args.dir
                 ))
             elif args.file_command == "backups":
-                list_backups(args.dir)
+                list_backups(args.dir, args.deep)
             elif args.file_command == "backup-info":
                 show_backup_details(args.backup_id, args.dir)
             elif args.file_command == "backup-delete":
@@ -6,21 +6,124 @@ a structured directory containing YAML/JSON files and markdown prompts.
 """
 
 import os
-import yaml
+import re
+import copy
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Set
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set, Tuple
 from dataclasses import dataclass
 
-from ..core.models import (
-    Assistant,
-    AssistantCreateRequest,
-    Voice,
-    ModelConfig,
-    Tool,
-    Transcriber,
-    Server
-)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# yaml and the Pydantic models are imported where they are used, so that
+# listing or peeking at assistants does not pay for loading them
+if TYPE_CHECKING:
+    from ..core.models import AssistantCreateRequest
+
+
+_YAML_SUFFIXES = frozenset({'.yaml', '.yml'})
+_CONFIG_SUFFIXES = _YAML_SUFFIXES | {'.json'}
+# Load order for schema and tool files; when two files share a stem the
+# later suffix wins, so JSON takes precedence over .yml over .yaml
+_CONFIG_SUFFIX_RANK = {'.yaml': 0, '.yml': 1, '.json': 2}
+_EVENT_SUFFIXES = frozenset({'.js', '.py'})
+
+_REQUIRED_FIELDS = ('name', 'model', 'voice')
+
+# Map provider names from config to VAPI API names; other providers remain the same
+_PROVIDER_MAPPING = {
+    'elevenlabs': '11labs',
+    'rime': 'rime-ai',
+}
+
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# endCall and transferCall built-ins are handled separately in _build_tools
+_SKIP_VAPI_TOOLS = frozenset({'endCall', 'transferCall'})
+
+# (system, user) prompt template names (file stems) for each analysis plan
+_PROMPT_FILES = {
+    'summaryPlan': ('summary-system-prompt', 'summary-user-prompt'),
+    'structuredDataPlan': ('extraction-system-prompt', 'extraction-user-prompt'),
+}
+
+# Loaded prompts per prompts directory, keyed with the (name, mtime, size)
+# signature of its markdown files so edits invalidate the entry
+_PROMPT_CACHE: Dict[str, Tuple[Tuple, Dict[str, str]]] = {}
+
+# Prompts an assistant cannot be deployed correctly without; failing to read
+# one is an error, while other templates are skipped with a warning
+_REQUIRED_PROMPTS = frozenset({'system', 'first_message'})
+
+
+def _yaml_safe_load(stream: Any) -> Any:
+    """Equivalent of yaml.safe_load using the libyaml-backed loader when available."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _load_all_prompts(assistant_path: Path) -> Dict[str, str]:
+    """
+    Load every markdown prompt of an assistant with a single directory scan.
+
+    Args:
+        assistant_path: Path to the assistant directory
+
+    Returns:
+        Dictionary mapping prompt name (file stem) to its stripped content
+
+    Raises:
+        OSError, UnicodeDecodeError: If the system or first message prompt
+            exists but cannot be read
+    """
+    prompts_dir = os.path.join(assistant_path, "prompts")
+
+    try:
+        with os.scandir(prompts_dir) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith('.md') and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+    stats = [(entry, entry.stat()) for entry in entries]
+    signature = tuple(sorted((entry.name, st.st_mtime_ns, st.st_size) for entry, st in stats))
+    cached = _PROMPT_CACHE.get(prompts_dir)
+    if cached and cached[0] == signature:
+        return dict(cached[1])
+
+    prompts = {}
+    complete = True
+    for entry, _ in stats:
+        prompt_name = entry.name[:-3]
+        try:
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                prompts[prompt_name] = f.read().strip()
+        except Exception as e:
+            if prompt_name in _REQUIRED_PROMPTS:
+                raise
+            print(f"Warning: Failed to load prompt template '{entry.name}': {str(e)}")
+            complete = False
+
+    # A directory with unreadable templates is not cached, so it is retried
+    if complete:
+        _PROMPT_CACHE[prompts_dir] = (signature, prompts)
+    return dict(prompts)
+
+
+def _config_files_in_load_order(directory: Path) -> List[Path]:
+    """Return the YAML/JSON files of a directory, ordered by suffix rank then name."""
+    return sorted(
+        (path for path in directory.iterdir() if path.suffix in _CONFIG_SUFFIX_RANK),
+        key=lambda path: (_CONFIG_SUFFIX_RANK[path.suffix], path.name)
+    )
 
 
 class CircularReferenceError(Exception):
@@ -58,8 +161,13 @@ class AssistantConfig:
 class AssistantConfigLoader:
     """Loads assistant configuration from file structure."""
 
-    def __init__(self, base_dir: str = "assistants"):
+    def __init__(self, base_dir: str = "assistants", shared_tools_dir: str = "shared/tools"):
         self.base_dir = Path(base_dir)
+        self.shared_tools_dir = Path(shared_tools_dir)
+        self._project_root: Optional[Path] = None
+        # Parsed shared tool files keyed by resolved path, so each file is read once
+        self._ref_registry: Dict[Path, Any] = {}
+        self._ref_registry_warmed = False
 
     def load_assistant(self, assistant_name: str, environment: str = "default") -> AssistantConfig:
         """
@@ -77,21 +185,22 @@ class AssistantConfigLoader:
         if not assistant_path.exists():
             raise FileNotFoundError(f"Assistant directory not found: {assistant_path}")
 
-        # Load main configuration
-        config = self._load_config_file(assistant_path / "assistant.yaml", environment)
-
-        # Load prompts
-        system_prompt = self._load_text_file(assistant_path / "prompts" / "system.md")
-        first_message = self._load_text_file(assistant_path / "prompts" / "first_message.md")
-
-        # Load schemas
-        schemas = self._load_schemas(assistant_path / "schemas")
-
-        # Load tools
-        tools = self._load_tools(assistant_path / "tools")
+        # The config, prompts, schemas, tools and events are independent files,
+        # so read and parse them concurrently and collect results in fixed order
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._load_config_file, assistant_path / "assistant.yaml", environment),
+                executor.submit(_load_all_prompts, assistant_path),
+                executor.submit(self._load_schemas, assistant_path / "schemas"),
+                executor.submit(self._load_tools, assistant_path / "tools"),
+                executor.submit(self._load_events, assistant_path / "events"),
+            ]
+            config, prompts, schemas, tools, events = [
+                future.result() for future in futures
+            ]
 
-        # Load events
-        events = self._load_events(assistant_path / "events")
+        system_prompt = prompts.get("system")
+        first_message = prompts.get("first_message")
 
         return AssistantConfig(
             name=assistant_name,
@@ -109,13 +218,10 @@ class AssistantConfigLoader:
         if not file_path.exists():
             return {}
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            if file_path.suffix in ['.yaml', '.yml']:
-                config = yaml.safe_load(f) or {}
-            elif file_path.suffix == '.json':
-                config = json.load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {file_path.suffix}")
+        if file_path.suffix not in _CONFIG_SUFFIXES:
+            raise ValueError(f"Unsupported file format: {file_path.suffix}")
+
+        config = self._parse_data_file(file_path) or {}
 
         # Apply environment-specific overrides
         if environment != "default" and "environments" in config:
@@ -139,14 +245,6 @@ class AssistantConfigLoader:
 
         return result
 
-    def _load_text_file(self, file_path: Path) -> Optional[str]:
-        """Load a text file (markdown, txt, etc.)."""
-        if not file_path.exists():
-            return None
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read().strip()
-
     def _load_schemas(self, schemas_dir: Path) -> Dict[str, Any]:
         """Load all schema files from the schemas directory."""
         schemas = {}
@@ -154,14 +252,8 @@ class AssistantConfigLoader:
         if not schemas_dir.exists():
             return schemas
 
-        for suffix in ['.yaml', '.yml', '.json']:
-            for file_path in schemas_dir.glob(f"*{suffix}"):
-                schema_name = file_path.stem
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    if file_path.suffix in ['.yaml', '.yml']:
-                        schemas[schema_name] = yaml.safe_load(f)
-                    elif file_path.suffix == '.json':
-                        schemas[schema_name] = json.load(f)
+        for file_path in _config_files_in_load_order(schemas_dir):
+            schemas[file_path.stem] = self._parse_data_file(file_path)
 
         return schemas
 
@@ -172,31 +264,24 @@ class AssistantConfigLoader:
         if not tools_dir.exists():
             return tools
 
-        for suffix in ['.yaml', '.yml', '.json']:
-            for file_path in tools_dir.glob(f"*{suffix}"):
-                tool_name = file_path.stem
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    if file_path.suffix in ['.yaml', '.yml']:
-                        tool_config = yaml.safe_load(f)
-                    elif file_path.suffix == '.json':
-                        tool_config = json.load(f)
+        for file_path in _config_files_in_load_order(tools_dir):
+            tool_name = file_path.stem
+            tool_config = self._parse_data_file(file_path)
+
+            # Process shared tool references if functions exist
+            if tool_config and 'functions' in tool_config:
+                resolved_functions = []
+                for tool_def in tool_config.get('functions', []):
+                    if isinstance(tool_def, dict) and '$ref' in tool_def:
+                        # Resolve the tool reference
+                        resolved_tool = self._resolve_tool_reference(tool_def, visited=set())
+                        resolved_functions.append(resolved_tool)
                     else:
-                        continue
+                        # Standard locally-defined tool
+                        resolved_functions.append(tool_def)
+                tool_config['functions'] = resolved_functions
 
-                    # Process shared tool references if functions exist
-                    if tool_config and 'functions' in tool_config:
-                        resolved_functions = []
-                        for tool_def in tool_config.get('functions', []):
-                            if isinstance(tool_def, dict) and '$ref' in tool_def:
-                                # Resolve the tool reference
-                                resolved_tool = self._resolve_tool_reference(tool_def, visited=set())
-                                resolved_functions.append(resolved_tool)
-                            else:
-                                # Standard locally-defined tool
-                                resolved_functions.append(tool_def)
-                        tool_config['functions'] = resolved_functions
-
-                    tools[tool_name] = tool_config
+            tools[tool_name] = tool_config
 
         return tools
 
@@ -207,7 +292,11 @@ class AssistantConfigLoader:
         if not events_dir.exists():
             return events
 
-        for file_path in events_dir.glob("*.{js,py}"):
+        # pathlib does not brace-expand globs, so filter a single listing by suffix
+        for file_path in sorted(events_dir.iterdir()):
+            if file_path.suffix not in _EVENT_SUFFIXES:
+                continue
+
             event_name = file_path.stem
             with open(file_path, 'r', encoding='utf-8') as f:
                 events[event_name] = f.read()
@@ -234,14 +323,8 @@ class AssistantConfigLoader:
         if not ref_path_str:
             return tool_def
 
-        # Find project root (look for pyproject.toml or fallback to current directory)
-        project_root = Path.cwd()
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / 'pyproject.toml').exists() or (current / '.git').exists():
-                project_root = current
-                break
-            current = current.parent
+        project_root = self._get_project_root()
+        self._warm_ref_registry(project_root)
 
         # Resolve the reference path
         ref_path = project_root / ref_path_str
@@ -258,23 +341,24 @@ class AssistantConfigLoader:
         if ref_path in visited:
             raise CircularReferenceError(f"Circular reference detected: {ref_path}")
 
+        # The same set is shared down the reference chain; the path is removed
+        # again on unwind so sibling references are not flagged as cycles
         visited.add(ref_path)
+        try:
+            # Load the referenced file, reusing the registry entry when available
+            if ref_path not in self._ref_registry:
+                if not ref_path.exists():
+                    raise FileNotFoundError(f"Shared tool reference not found: {ref_path}")
 
-        # Load the referenced file
-        if not ref_path.exists():
-            raise FileNotFoundError(f"Shared tool reference not found: {ref_path}")
+                self._ref_registry[ref_path] = self._parse_data_file(ref_path)
 
-        with open(ref_path, 'r', encoding='utf-8') as f:
-            if ref_path.suffix in ['.yaml', '.yml']:
-                base_tool_config = yaml.safe_load(f)
-            elif ref_path.suffix == '.json':
-                base_tool_config = json.load(f)
-            else:
-                raise InvalidToolReferenceError(f"Unsupported file format: {ref_path.suffix}")
+            base_tool_config = copy.deepcopy(self._ref_registry[ref_path])
 
-        # Recursively resolve if the base file also has a reference
-        if isinstance(base_tool_config, dict) and '$ref' in base_tool_config:
-            base_tool_config = self._resolve_tool_reference(base_tool_config, visited.copy())
+            # Recursively resolve if the base file also has a reference
+            if isinstance(base_tool_config, dict) and '$ref' in base_tool_config:
+                base_tool_config = self._resolve_tool_reference(base_tool_config, visited)
+        finally:
+            visited.discard(ref_path)
 
         # Deep merge with overrides if present
         if 'overrides' in tool_def and tool_def['overrides']:
@@ -282,6 +366,63 @@ class AssistantConfigLoader:
 
         return base_tool_config
 
+    def _get_project_root(self) -> Path:
+        """Find the project root (pyproject.toml or .git), falling back to the current directory."""
+        if self._project_root is None:
+            project_root = Path.cwd()
+            current = Path.cwd()
+            while current != current.parent:
+                if (current / 'pyproject.toml').exists() or (current / '.git').exists():
+                    project_root = current
+                    break
+                current = current.parent
+            self._project_root = project_root
+
+        return self._project_root
+
+    def _parse_data_file(self, file_path: Path) -> Any:
+        """Parse a YAML/JSON data file, using orjson for JSON when it is installed."""
+        if file_path.suffix in _YAML_SUFFIXES:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return _yaml_safe_load(f)
+        elif file_path.suffix == '.json':
+            with open(file_path, 'rb') as f:
+                return _json_loads(f.read())
+        else:
+            raise InvalidToolReferenceError(f"Unsupported file format: {file_path.suffix}")
+
+    def _warm_ref_registry(self, project_root: Path) -> None:
+        """Parse every shared tool file once, in parallel, into the reference registry."""
+        import yaml
+
+        if self._ref_registry_warmed:
+            return
+
+        shared_dir = project_root / self.shared_tools_dir
+        if not shared_dir.is_dir():
+            self._ref_registry_warmed = True
+            return
+
+        file_paths = [
+            path.resolve() for path in shared_dir.rglob('*')
+            if path.suffix in _CONFIG_SUFFIXES and path.is_file()
+        ]
+
+        def parse(file_path: Path) -> None:
+            try:
+                self._ref_registry[file_path] = self._parse_data_file(file_path)
+            except (OSError, ValueError, yaml.YAMLError):
+                # Left out of the registry (ValueError covers undecodable text
+                # and malformed JSON); a reference to it reports the error
+                pass
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(parse, file_paths))
+
+        # Only marked once every file has been tried, so an interrupted scan
+        # is retried on the next lookup
+        self._ref_registry_warmed = True
+
     def _deep_merge(self, base: dict, override: dict) -> dict:
         """
         Recursively merge two dictionaries. Arrays are combined and deduplicated.
@@ -304,18 +445,19 @@ class AssistantConfigLoader:
                     # Recursively merge nested dictionaries
                     result[key] = self._deep_merge(result[key], value)
                 elif isinstance(result[key], list) and isinstance(value, list):
-                    # Combine lists and remove duplicates while preserving order
-                    combined = result[key] + value
+                    # Combine lists and remove duplicates while preserving order,
+                    # walking both lists in turn rather than concatenating them
                     seen = set()
                     deduplicated = []
-                    for item in combined:
-                        # For hashable items
-                        if isinstance(item, (str, int, float, bool, tuple)):
-                            if item not in seen:
+                    for items in (result[key], value):
+                        for item in items:
+                            try:
+                                if item in seen:
+                                    continue
                                 seen.add(item)
-                                deduplicated.append(item)
-                        else:
-                            # For non-hashable items (dicts, lists), include all
+                            except TypeError:
+                                # For non-hashable items (dicts, lists), include all
+                                pass
                             deduplicated.append(item)
                     result[key] = deduplicated
                 else:
@@ -336,9 +478,7 @@ class AssistantConfigLoader:
 
     def validate_config(self, config: AssistantConfig) -> bool:
         """Validate that an assistant configuration has required fields."""
-        required_fields = ['name', 'model', 'voice']
-
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in config.config:
                 return False
 
@@ -349,7 +489,7 @@ class AssistantBuilder:
     """Builds VAPI Assistant objects from configuration."""
 
     @staticmethod
-    def build_from_config(config: AssistantConfig) -> AssistantCreateRequest:
+    def build_from_config(config: AssistantConfig) -> "AssistantCreateRequest":
         """
         Build a VAPI AssistantCreateRequest from an AssistantConfig.
 
@@ -359,6 +499,8 @@ class AssistantBuilder:
         Returns:
             AssistantCreateRequest ready to send to VAPI API
         """
+        from ..core.models import AssistantCreateRequest, ModelConfig, Transcriber, Server
+
         assistant_config = config.config
 
         # Build Voice configuration
@@ -367,12 +509,7 @@ class AssistantBuilder:
         # Map provider names from config to VAPI API names
         provider = voice_config.get('provider')
         if provider:
-            provider_mapping = {
-                'elevenlabs': '11labs',
-                'rime': 'rime-ai',
-                # Other providers remain the same
-            }
-            provider = provider_mapping.get(provider, provider)
+            provider = _PROVIDER_MAPPING.get(provider, provider)
 
         # Create voice dict for direct VAPI API
         voice_data = {
@@ -427,45 +564,53 @@ class AssistantBuilder:
                     timeout_seconds=server_config.get('timeoutSeconds')
                 )
 
-        # Get firstMessageMode value
+        # Create the assistant request
+        # Build the request data as a dictionary first to use aliases properly,
+        # only adding optional fields that are actually set
+        request_data = {
+            'voice': voice,
+            'model': model
+        }
+
+        name = assistant_config.get('name')
+        if name is not None:
+            request_data['name'] = name
+
+        if transcriber is not None:
+            request_data['transcriber'] = transcriber
+
+        first_message = config.first_message or assistant_config.get('firstMessage')
+        if first_message is not None:
+            request_data['firstMessage'] = first_message
+
+        # Use the original string value with alias
         first_message_mode_value = assistant_config.get('firstMessageMode')
+        if first_message_mode_value is not None:
+            request_data['firstMessageMode'] = first_message_mode_value
 
-        # Get serverMessages value
         server_messages = assistant_config.get('serverMessages')
+        if server_messages is not None:
+            request_data['serverMessages'] = server_messages
 
         # Build AnalysisPlan if present in configuration
-        analysis_plan = None
         if 'analysisPlan' in assistant_config:
             analysis_plan = AssistantBuilder._build_analysis_plan(assistant_config['analysisPlan'], config.schemas, config.base_path)
+            if analysis_plan is not None:
+                request_data['analysisPlan'] = analysis_plan
+
+        # Add BackgroundSpeechDenoisingPlan if present in configuration
+        background_speech_denoising_plan = assistant_config.get('backgroundSpeechDenoisingPlan')
+        if background_speech_denoising_plan is not None:
+            request_data['backgroundSpeechDenoisingPlan'] = background_speech_denoising_plan
 
         # Build Hooks if present in configuration
-        hooks = None
         if 'hooks' in assistant_config:
             hooks = AssistantBuilder._build_hooks(assistant_config['hooks'])
+            if hooks is not None:
+                request_data['hooks'] = hooks
 
-        # Build BackgroundSpeechDenoisingPlan if present in configuration
-        background_speech_denoising_plan = None
-        if 'backgroundSpeechDenoisingPlan' in assistant_config:
-            background_speech_denoising_plan = assistant_config['backgroundSpeechDenoisingPlan']
-
-        # Create the assistant request
-        # Build the request data as a dictionary first to use aliases properly
-        request_data = {
-            'name': assistant_config.get('name'),
-            'voice': voice,
-            'model': model,
-            'transcriber': transcriber,
-            'firstMessage': config.first_message or assistant_config.get('firstMessage'),
-            'firstMessageMode': first_message_mode_value,  # Use the original string value with alias
-            'serverMessages': server_messages,  # Add server messages support
-            'analysisPlan': analysis_plan,  # Add analysis plan support
-            'backgroundSpeechDenoisingPlan': background_speech_denoising_plan,  # Add background speech denoising support
-            'hooks': hooks,  # Add hooks support
-            'server': server
-        }
-
-        # Remove None values
-        request_data = {k: v for k, v in request_data.items() if v is not None}
+        if server is not None:
+            request_data['server'] = server
 
         # Create request using model_validate
         request = AssistantCreateRequest.model_validate(request_data)
@@ -476,88 +621,86 @@ class AssistantBuilder:
     def _build_tools(tools_config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Build tools list from tools configuration for direct VAPI API."""
         tools = []
+        tools_append = tools.append
+        build_tool_messages = AssistantBuilder._build_tool_messages
 
         # Process functions
-        if 'functions' in tools_config and tools_config['functions']:
-            functions = tools_config['functions'].get('functions', [])
-            for func in functions:
+        functions_config = tools_config.get('functions')
+        if functions_config:
+            for func in functions_config.get('functions', []):
+                func_get = func.get
+
                 # Create function tool for VAPI API
                 tool = {
                     "type": "function",
                     "function": {
-                        "name": func.get("name"),
-                        "description": func.get("description"),
-                        "parameters": func.get("parameters", {})
+                        "name": func_get("name"),
+                        "description": func_get("description"),
+                        "parameters": func_get("parameters", {})
                     }
                 }
 
                 # Add server configuration if present
-                if 'server' in func and func['server']:
-                    tool['server'] = func['server']
+                server = func_get('server')
+                if server:
+                    tool['server'] = server
 
                 # Add messages configuration if present
-                if 'messages' in func and func['messages']:
-                    if isinstance(func['messages'], list):
-                        tool['messages'] = AssistantBuilder._build_tool_messages(func['messages'])
+                messages = func_get('messages')
+                if messages and isinstance(messages, list):
+                    tool['messages'] = build_tool_messages(messages)
 
-                tools.append(tool)
+                tools_append(tool)
 
         # Process transfers
         if 'transfers' in tools_config:
-            transfers_data = tools_config['transfers']
-
             # Look for transfers list in the config
-            transfer_list = transfers_data.get('transfers', [])
-
-            # Group transfers by type for better organization
-            phone_destinations = []
-            assistant_transfers = []
+            transfer_list = tools_config['transfers'].get('transfers', [])
 
+            # Only phone number transfers are supported for now; assistant
+            # transfers need valid assistant IDs and numbers still holding an
+            # unresolved environment variable are skipped
+            valid_destinations = []
             for transfer in transfer_list:
-                if transfer.get('type') == 'number':
-                    phone_destinations.append({
+                transfer_get = transfer.get
+                if transfer_get('type') != 'number':
+                    continue
+
+                number = transfer_get('number')
+                if number and not number.startswith('${'):
+                    valid_destinations.append({
                         "type": "number",
-                        "number": transfer.get('number'),
-                        "description": transfer.get('description', '')
+                        "number": number,
+                        "description": transfer_get('description', '')
                     })
-                elif transfer.get('type') == 'assistant':
-                    # For assistant transfers, we'll need to handle them differently
-                    # For now, skip assistant transfers as they need valid assistant IDs
-                    pass
 
             # Add transfer tool if we have phone destinations
-            if phone_destinations:
-                # Only add valid phone numbers (skip environment variables for now)
-                valid_destinations = [
-                    dest for dest in phone_destinations
-                    if dest['number'] and not dest['number'].startswith('${')
-                ]
-
-                if valid_destinations:
-                    tool = {
-                        "type": "transferCall",
-                        "destinations": valid_destinations
-                    }
-                    tools.append(tool)
+            if valid_destinations:
+                tools_append({
+                    "type": "transferCall",
+                    "destinations": valid_destinations
+                })
 
         # Process VAPI built-in tools from tool configs
-        for tool_name, tool_config in tools_config.items():
-            if isinstance(tool_config, dict) and tool_config.get('type') == 'vapi-builtin-collection':
-                vapi_tool_configs = tool_config.get('vapi_tools', {})
-                for vapi_tool_name, vapi_tool_config in vapi_tool_configs.items():
-                    if not vapi_tool_config.get('enabled', False):
-                        continue
+        for tool_config in tools_config.values():
+            if not isinstance(tool_config, dict) or tool_config.get('type') != 'vapi-builtin-collection':
+                continue
 
-                    # Skip endCall and transferCall as they're handled elsewhere
-                    if vapi_tool_name in ['endCall', 'transferCall']:
-                        continue
+            for vapi_tool_name, vapi_tool_config in tool_config.get('vapi_tools', {}).items():
+                vapi_get = vapi_tool_config.get
+                if not vapi_get('enabled', False):
+                    continue
 
-                    vapi_tool = {"type": vapi_tool_config.get('type', vapi_tool_name)}
+                # Skip endCall and transferCall as they're handled elsewhere
+                if vapi_tool_name in _SKIP_VAPI_TOOLS:
+                    continue
 
-                    if vapi_tool_name == 'voicemail' and 'message' in vapi_tool_config:
-                        vapi_tool['message'] = vapi_tool_config['message']
+                vapi_tool = {"type": vapi_get('type', vapi_tool_name)}
 
-                    tools.append(vapi_tool)
+                if vapi_tool_name == 'voicemail' and 'message' in vapi_tool_config:
+                    vapi_tool['message'] = vapi_tool_config['message']
+
+                tools_append(vapi_tool)
 
         # Add endCall tool (check for configuration first)
         endcall_config = tools_config.get('endcall', {})
@@ -566,11 +709,11 @@ class AssistantBuilder:
         endcall_tool = {"type": "endCall"}
 
         # Add messages configuration if present
-        if 'messages' in endcall_config and endcall_config['messages']:
-            if isinstance(endcall_config['messages'], list):
-                endcall_tool['messages'] = AssistantBuilder._build_tool_messages(endcall_config['messages'])
+        endcall_messages = endcall_config.get('messages')
+        if endcall_messages and isinstance(endcall_messages, list):
+            endcall_tool['messages'] = build_tool_messages(endcall_messages)
 
-        tools.append(endcall_tool)
+        tools_append(endcall_tool)
 
         return tools
 
@@ -580,14 +723,15 @@ class AssistantBuilder:
         if not isinstance(value, str):
             return value
 
-        import re
-        pattern = r'\$\{([^}]+)\}'
+        # Most values carry no placeholder, so skip the regex entirely
+        if '${' not in value:
+            return value
 
         def replacer(match):
             env_var = match.group(1)
             return os.environ.get(env_var, match.group(0))
 
-        return re.sub(pattern, replacer, value)
+        return _ENV_VAR_RE.sub(replacer, value)
 
     @staticmethod
     def _build_tool_messages(messages_config: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -645,35 +789,6 @@ class AssistantBuilder:
 
         return messages
 
-    @staticmethod
-    def _load_prompt_template(assistant_path: Path, prompt_name: str) -> Optional[str]:
-        """
-        Load a prompt template from the assistant's prompts directory.
-
-        Args:
-            assistant_path: Path to the assistant directory
-            prompt_name: Name of the prompt file (e.g., 'summary-system-prompt.md')
-
-        Returns:
-            Prompt content or None if not found
-        """
-        prompts_dir = assistant_path / "prompts"
-
-        if not prompts_dir.exists():
-            return None
-
-        prompt_path = prompts_dir / prompt_name
-
-        if not prompt_path.exists():
-            return None
-
-        try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        except Exception as e:
-            print(f"Warning: Failed to load prompt template '{prompt_name}': {str(e)}")
-            return None
-
     @staticmethod
     def _build_analysis_plan(analysis_config: Dict[str, Any], schemas: Dict[str, Any], assistant_path: Optional[Path] = None) -> Dict[str, Any]:
         """
@@ -690,6 +805,7 @@ class AssistantBuilder:
         from ..core.models.assistant import AnalysisPlan, SummaryPlan, StructuredDataPlan
 
         analysis_plan_data = {}
+        prompts = _load_all_prompts(assistant_path) if assistant_path else {}
 
         # Add minMessagesThreshold
         if 'minMessagesThreshold' in analysis_config:
@@ -707,8 +823,9 @@ class AssistantBuilder:
 
             # Check for prompt files first, fall back to config messages
             if assistant_path:
-                system_prompt = AssistantBuilder._load_prompt_template(assistant_path, 'summary-system-prompt.md')
-                user_prompt = AssistantBuilder._load_prompt_template(assistant_path, 'summary-user-prompt.md')
+                system_name, user_name = _PROMPT_FILES['summaryPlan']
+                system_prompt = prompts.get(system_name)
+                user_prompt = prompts.get(user_name)
 
                 if system_prompt and user_prompt:
                     summary_plan_data['messages'] = [
@@ -747,8 +864,9 @@ class AssistantBuilder:
 
             # Check for prompt files first, fall back to config messages
             if assistant_path:
-                system_prompt = AssistantBuilder._load_prompt_template(assistant_path, 'extraction-system-prompt.md')
-                user_prompt = AssistantBuilder._load_prompt_template(assistant_path, 'extraction-user-prompt.md')
+                system_name, user_name = _PROMPT_FILES['structuredDataPlan']
+                system_prompt = prompts.get(system_name)
+                user_prompt = prompts.get(user_name)
 
                 if system_prompt and user_prompt:
                     structured_plan_data['messages'] = [
@@ -5,14 +5,154 @@ Validates assistant template existence and creates missing templates during
 squad manifest creation for improved developer experience.
 """
 
+import copy
+import os
 import yaml
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from rich.console import Console
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
 console = Console()
 
+# Default configuration for auto-created assistants. Each validator works on
+# its own deep copy, so this template is never mutated.
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "_vapi": {
+        "current_environment": "development",
+        "environments": {
+            "development": {
+                "deployed_at": None,
+                "deployed_by": None,
+                "id": None,
+                "version": 0
+            },
+            "staging": {
+                "deployed_at": None,
+                "deployed_by": None,
+                "id": None,
+                "version": 0
+            },
+            "production": {
+                "deployed_at": None,
+                "deployed_by": None,
+                "id": None,
+                "version": 0
+            }
+        },
+        "last_sync": None
+    },
+    "description": "AI assistant for handling user inquiries",
+    "model": {
+        "provider": "openai",
+        "model": "gpt-4o-mini",
+        "temperature": 0.7
+    },
+    "voice": {
+        "provider": "minimax",
+        "voiceId": "business_female_1_v1"
+    },
+    "transcriber": {
+        "provider": "deepgram",
+        "model": "nova-2",
+        "language": "en"
+    },
+    "firstMessageMode": "assistant-speaks-first-with-model-generated-message",
+    "server": {
+        "url": "https://n8n-2-u19609.vm.elestio.app/webhook/{{assistant_name}}",
+        "timeoutSeconds": 20
+    },
+    "serverMessages": ["end-of-call-report"],
+    "environments": {
+        "development": {
+            "model": {
+                "model": "gpt-3.5-turbo",
+                "temperature": 0.8
+            },
+            "firstMessageMode": "assistant-speaks-first"
+        },
+        "staging": {
+            "firstMessageMode": "wait-for-user",
+            "voice": {
+                "voiceId": "business_female_1_v1"
+            }
+        },
+        "production": {
+            "model": {
+                "model": "gpt-4o-mini",
+                "temperature": 0.6
+            },
+            "firstMessageMode": "assistant-speaks-first-with-model-generated-message"
+        }
+    },
+    "features": {
+        "enableAnalytics": True,
+        "enableRecording": True,
+        "enableTranscription": True
+    },
+    "metadata": {
+        "author": "Squad Template Creator",
+        "tags": ["auto-generated"],
+        "template": "auto_created",
+        "version": "1.0.0"
+    }
+}
+
+# Default tools/functions.yaml content for auto-created assistants
+_DEFAULT_TOOLS_CONFIG: Dict[str, Any] = {
+    "functions": [
+        {
+            "name": "get_information",
+            "description": "Get general information to help users",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "The information request from the user"
+                    }
+                },
+                "required": ["query"]
+            }
+        }
+    ]
+}
+
+# Role descriptions keyed by name fragments, checked in priority order
+_ROLE_DESCRIPTIONS = (
+    (("triage",), "reception and triage"),
+    (("booking", "schedule"), "booking and scheduling"),
+    (("info",), "information and research"),
+    (("support",), "customer support"),
+    (("sales",), "sales and consultation"),
+)
+
+_default_config_yaml: Optional[str] = None
+_default_tools_yaml: Optional[str] = None
+
+
+def _get_default_config_yaml() -> str:
+    """Serialize the default configuration once and reuse the YAML text."""
+    global _default_config_yaml
+    if _default_config_yaml is None:
+        _default_config_yaml = yaml.dump(
+            _DEFAULT_CONFIG_TEMPLATE, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+        )
+    return _default_config_yaml
+
+
+def _get_default_tools_yaml() -> str:
+    """Serialize the default tools configuration once and reuse the YAML text."""
+    global _default_tools_yaml
+    if _default_tools_yaml is None:
+        _default_tools_yaml = yaml.dump(_DEFAULT_TOOLS_CONFIG, Dumper=_SafeDumper, default_flow_style=False)
+    return _default_tools_yaml
+
 
 @dataclass
 class ValidationResult:
@@ -55,6 +195,8 @@ class AssistantTemplateValidator:
             default_config: Default configuration for auto-created assistants
         """
         self.assistants_dir = Path(assistants_dir)
+        # Whether default_config came from the caller rather than the template
+        self._custom_default_config = bool(default_config)
         self.default_config = default_config or self._get_default_config()
 
     def exists(self, assistant_name: str) -> bool:
@@ -67,9 +209,12 @@ class AssistantTemplateValidator:
         Returns:
             True if assistant template exists, False otherwise
         """
-        assistant_path = self.assistants_dir / assistant_name
-        config_file = assistant_path / "assistant.yaml"
-        return config_file.exists()
+        config_file = self.assistants_dir / assistant_name / "assistant.yaml"
+        try:
+            os.stat(config_file)
+        except OSError:
+            return False
+        return True
 
     def validate_all_assistants(
         self,
@@ -94,27 +239,28 @@ class AssistantTemplateValidator:
             warnings=[]
         )
 
+        # Read the assistants directory once; a successful create_template adds
+        # the name, so no second check is needed afterwards
+        existing = set(self._scan_existing_assistants())
+
         for assistant_name in assistant_names:
-            if not self.exists(assistant_name):
-                result.missing_assistants.append(assistant_name)
-
-                if auto_create:
-                    try:
-                        self.create_template(assistant_name)
-                        result.created_assistants.append(assistant_name)
-                        console.print(f"[green]Created assistant template: {assistant_name}[/green]")
-                    except Exception as e:
-                        result.errors.append(f"Failed to create {assistant_name}: {str(e)}")
-                        result.is_valid = False
-                else:
-                    result.errors.append(f"Assistant template not found: {assistant_name}")
+            if assistant_name in existing:
+                continue
+
+            result.missing_assistants.append(assistant_name)
+
+            if auto_create:
+                try:
+                    self.create_template(assistant_name)
+                    existing.add(assistant_name)
+                    result.created_assistants.append(assistant_name)
+                    console.print(f"[green]Created assistant template: {assistant_name}[/green]")
+                except Exception as e:
+                    result.errors.append(f"Failed to create {assistant_name}: {str(e)}")
                     result.is_valid = False
-
-        # Final validation - check if all assistants now exist
-        still_missing = [name for name in assistant_names if not self.exists(name)]
-        if still_missing:
-            result.is_valid = False
-            result.errors.extend([f"Assistant still missing after creation: {name}" for name in still_missing])
+            else:
+                result.errors.append(f"Assistant template not found: {assistant_name}")
+                result.is_valid = False
 
         return result
 
@@ -143,18 +289,31 @@ class AssistantTemplateValidator:
         (assistant_path / "tools").mkdir(exist_ok=True)
         (assistant_path / "prompts").mkdir(exist_ok=True)
 
-        # Prepare configuration
-        config = self.default_config.copy()
-        if custom_config:
-            config.update(custom_config)
-
-        # Set assistant name
-        config["name"] = assistant_name
-
         # Create assistant.yaml
         config_file = assistant_path / "assistant.yaml"
-        with open(config_file, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        if (
+            not custom_config
+            and not self._custom_default_config
+            and self.default_config == _DEFAULT_CONFIG_TEMPLATE
+        ):
+            # The config is the unmodified default template, which has no name
+            # key, so the name is emitted as the last top-level entry after the
+            # pre-serialized defaults
+            config_yaml = _get_default_config_yaml() + yaml.dump(
+                {"name": assistant_name}, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+            )
+        else:
+            # Prepare configuration
+            config = self.default_config.copy()
+            if custom_config:
+                config.update(custom_config)
+
+            # Set assistant name
+            config["name"] = assistant_name
+
+            config_yaml = yaml.dump(config, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+
+        config_file.write_text(config_yaml, encoding='utf-8')
 
         # Create default system prompt
         self._create_default_system_prompt(assistant_path, assistant_name)
@@ -193,134 +352,25 @@ You are a {role_description} assistant designed to help users with their inquiri
 When you need to transfer a call, use the appropriate transfer function and explain to the user what you're doing.
 """
 
-        with open(prompt_file, 'w', encoding='utf-8') as f:
-            f.write(prompt_content)
+        prompt_file.write_text(prompt_content, encoding='utf-8')
 
     def _create_default_tools_config(self, assistant_path: Path):
         """Create default tools configuration."""
         tools_file = assistant_path / "tools" / "functions.yaml"
-
-        tools_config = {
-            "functions": [
-                {
-                    "name": "get_information",
-                    "description": "Get general information to help users",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "The information request from the user"
-                            }
-                        },
-                        "required": ["query"]
-                    }
-                }
-            ]
-        }
-
-        with open(tools_file, 'w', encoding='utf-8') as f:
-            yaml.dump(tools_config, f, default_flow_style=False)
+        tools_file.write_text(_get_default_tools_yaml(), encoding='utf-8')
 
     def _generate_role_description(self, assistant_name: str) -> str:
         """Generate a role description based on assistant name."""
         name_lower = assistant_name.lower()
 
-        if 'triage' in name_lower:
-            return "reception and triage"
-        elif 'booking' in name_lower or 'schedule' in name_lower:
-            return "booking and scheduling"
-        elif 'info' in name_lower or 'information' in name_lower:
-            return "information and research"
-        elif 'support' in name_lower:
-            return "customer support"
-        elif 'sales' in name_lower:
-            return "sales and consultation"
-        else:
-            return "specialized service"
+        for needles, description in _ROLE_DESCRIPTIONS:
+            if any(needle in name_lower for needle in needles):
+                return description
+        return "specialized service"
 
     def _get_default_config(self) -> Dict[str, Any]:
-        """Get default assistant configuration."""
-        return {
-            "_vapi": {
-                "current_environment": "development",
-                "environments": {
-                    "development": {
-                        "deployed_at": None,
-                        "deployed_by": None,
-                        "id": None,
-                        "version": 0
-                    },
-                    "staging": {
-                        "deployed_at": None,
-                        "deployed_by": None,
-                        "id": None,
-                        "version": 0
-                    },
-                    "production": {
-                        "deployed_at": None,
-                        "deployed_by": None,
-                        "id": None,
-                        "version": 0
-                    }
-                },
-                "last_sync": None
-            },
-            "description": "AI assistant for handling user inquiries",
-            "model": {
-                "provider": "openai",
-                "model": "gpt-4o-mini",
-                "temperature": 0.7
-            },
-            "voice": {
-                "provider": "minimax",
-                "voiceId": "business_female_1_v1"
-            },
-            "transcriber": {
-                "provider": "deepgram",
-                "model": "nova-2",
-                "language": "en"
-            },
-            "firstMessageMode": "assistant-speaks-first-with-model-generated-message",
-            "server": {
-                "url": "https://n8n-2-u19609.vm.elestio.app/webhook/{{assistant_name}}",
-                "timeoutSeconds": 20
-            },
-            "serverMessages": ["end-of-call-report"],
-            "environments": {
-                "development": {
-                    "model": {
-                        "model": "gpt-3.5-turbo",
-                        "temperature": 0.8
-                    },
-                    "firstMessageMode": "assistant-speaks-first"
-                },
-                "staging": {
-                    "firstMessageMode": "wait-for-user",
-                    "voice": {
-                        "voiceId": "business_female_1_v1"
-                    }
-                },
-                "production": {
-                    "model": {
-                        "model": "gpt-4o-mini",
-                        "temperature": 0.6
-                    },
-                    "firstMessageMode": "assistant-speaks-first-with-model-generated-message"
-                }
-            },
-            "features": {
-                "enableAnalytics": True,
-                "enableRecording": True,
-                "enableTranscription": True
-            },
-            "metadata": {
-                "author": "Squad Template Creator",
-                "tags": ["auto-generated"],
-                "template": "auto_created",
-                "version": "1.0.0"
-            }
-        }
+        """Get a fresh copy of the default assistant configuration."""
+        return copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
 
     def list_missing_assistants(self, assistant_names: List[str]) -> List[str]:
         """
@@ -332,7 +382,8 @@ When you need to transfer a call, use the appropriate transfer function and expl
         Returns:
             List of missing assistant names
         """
-        return [name for name in assistant_names if not self.exists(name)]
+        existing = self._scan_existing_assistants()
+        return [name for name in assistant_names if name not in existing]
 
     def get_existing_assistants(self) -> List[str]:
         """
@@ -341,12 +392,15 @@ When you need to transfer a call, use the appropriate transfer function and expl
         Returns:
             List of existing assistant template names
         """
-        if not self.assistants_dir.exists():
-            return []
-
-        existing = []
-        for item in self.assistants_dir.iterdir():
-            if item.is_dir() and (item / "assistant.yaml").exists():
-                existing.append(item.name)
-
-        return sorted(existing)
\ No newline at end of file
+        return sorted(self._scan_existing_assistants())
+
+    def _scan_existing_assistants(self) -> frozenset:
+        """Read the assistants directory once and return the template names found."""
+        try:
+            with os.scandir(self.assistants_dir) as it:
+                return frozenset(
+                    entry.name for entry in it
+                    if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "assistant.yaml"))
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return frozenset()
\ No newline at end of file
@@ -6,12 +6,28 @@ including local configurations, deployed VAPI data, and deployment state managem
 """
 
 import os
+import re
+import gzip
 import json
+import asyncio
+import copy
 import shutil
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import BinaryIO, Dict, List, Optional, Any, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 from ..services import AssistantService
 from ..core.assistant_config import AssistantConfigLoader
@@ -22,17 +38,129 @@ from ..core.backup_models import (
 )
 from ..core.exceptions.vapi_exceptions import VAPIException
 
+# Manifests are written with metadata, format version and checksum ahead of
+# the assistants, so those can be decoded alone, stopping before the payload
+_HEADER_OPEN_RE = re.compile(r'\s*\{\s*')
+_WHITESPACE_RE = re.compile(r'\s*')
+_HEADER_READ_CHUNK = 8192
+_HEADER_KEYS = frozenset({'metadata', 'backup_format_version', 'checksum'})
+
+# Assistant files that are never captured in a backup: known binary formats,
+# and anything larger than a prompt or config file could reasonably be
+_BINARY_SUFFIXES = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.ico', '.webp', '.pdf', '.zip', '.gz',
+    '.zst', '.tar', '.mp3', '.wav', '.ogg', '.pyc', '.so', '.dll', '.exe'
+})
+_MAX_BACKUP_FILE_BYTES = 10 * 1024 * 1024
+_BINARY_SNIFF_BYTES = 4096
+
+# Backup files are plain JSON, or JSON compressed with zstd or gzip
+_BACKUP_SUFFIXES = ('.json', '.json.zst', '.json.gz')
+
+# Upper bound on the backup metadata entries each BackupManager keeps
+_METADATA_CACHE_SIZE = 256
+
+
+def _estimate_json_size(value: Any) -> int:
+    """Approximate the JSON-encoded size of a value without serializing it."""
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(item) + 2
+        elif isinstance(item, dict):
+            size += 2 + 4 * len(item)
+            for key, child in item.items():
+                size += len(str(key)) + 2
+                stack.append(child)
+        elif isinstance(item, (list, tuple)):
+            size += 2 + len(item)
+            stack.extend(item)
+        elif item is None or isinstance(item, bool):
+            size += 5
+        else:
+            size += len(str(item))
+    return size
+
+
+def _parse_manifest_header(
+    decoder: json.JSONDecoder,
+    text: str
+) -> Optional[Tuple[Dict[str, Any], Optional[str]]]:
+    """
+    Decode the leading header entries of a manifest.
+
+    Returns:
+        (header, stop_key) where stop_key is the first key that is not a
+        header key (None if the object ended or is malformed), or None if
+        the text ends before that point and more input is needed
+    """
+    match = _HEADER_OPEN_RE.match(text)
+    if not match:
+        return None if not text.strip() else ({}, None)
+
+    header = {}
+    pos = match.end()
+    while True:
+        try:
+            key, pos = decoder.raw_decode(text, pos)
+            pos = _WHITESPACE_RE.match(text, pos).end()
+            if pos >= len(text):
+                return None
+            if not isinstance(key, str) or text[pos] != ':':
+                return header, None
+            if key not in _HEADER_KEYS:
+                return header, key
+            pos = _WHITESPACE_RE.match(text, pos + 1).end()
+            value, pos = decoder.raw_decode(text, pos)
+        except ValueError:
+            return None
+
+        # A value must be followed by a delimiter, which also rules out a
+        # number that was cut short at the end of the text
+        pos = _WHITESPACE_RE.match(text, pos).end()
+        if pos >= len(text):
+            return None
+        header[key] = value
+        if text[pos] != ',':
+            return header, None
+        pos = _WHITESPACE_RE.match(text, pos + 1).end()
+
+
+def open_backup_file(backup_path) -> BinaryIO:
+    """Open a backup file for binary reading, decompressing it if needed."""
+    backup_path = str(backup_path)
+    if backup_path.endswith('.gz'):
+        return gzip.open(backup_path, 'rb')
+    if backup_path.endswith('.zst'):
+        if zstandard is None:
+            raise VAPIException(f"Reading {backup_path} requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().stream_reader(open(backup_path, 'rb'), closefd=True)
+    return open(backup_path, 'rb')
+
 
 class BackupManager:
     """Manages backup and restore operations for assistants."""
 
-    def __init__(self, assistants_dir: str = "assistants", backups_dir: str = "backups"):
+    def __init__(
+        self,
+        assistants_dir: str = "assistants",
+        backups_dir: str = "backups",
+        compress: bool = False
+    ):
         self.assistants_dir = Path(assistants_dir)
         self.backups_dir = Path(backups_dir)
+        self.compress = compress
         self.assistant_service = AssistantService()
         self.config_loader = AssistantConfigLoader(assistants_dir)
         self.deployment_manager = DeploymentStateManager(assistants_dir)
 
+        # Backup metadata keyed by file path, reused while the file's
+        # (mtime_ns, size) signature is unchanged; least recently used
+        # entries are evicted beyond _METADATA_CACHE_SIZE
+        self._metadata_cache: Dict[str, Tuple[Tuple[int, int], BackupMetadata]] = OrderedDict()
+
         # Ensure backups directory exists
         self.backups_dir.mkdir(exist_ok=True)
 
@@ -57,8 +185,9 @@ class BackupManager:
         Returns:
             BackupManifest with complete backup data
         """
-        # Generate unique backup ID
-        backup_id = f"backup_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        # Generate unique backup ID; the same timestamp is recorded in the metadata
+        created_at = datetime.now(timezone.utc)
+        backup_id = f"backup_{created_at:%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
 
         # Determine assistants to backup
         if assistant_names is None:
@@ -74,28 +203,36 @@ class BackupManager:
         if missing_assistants:
             raise ValueError(f"Assistants not found: {', '.join(missing_assistants)}")
 
-        # Create backup data for each assistant
-        backup_data = []
-        total_size = 0
+        # Create backup data for each assistant, fetching from VAPI concurrently
+        semaphore = asyncio.Semaphore(8)
 
-        for assistant_name in assistant_names:
-            try:
-                assistant_backup = await self._backup_single_assistant(
+        async def backup_bounded(assistant_name: str) -> AssistantBackupData:
+            async with semaphore:
+                return await self._backup_single_assistant(
                     assistant_name, environment, backup_type
                 )
-                backup_data.append(assistant_backup)
 
-                # Calculate size (rough estimate)
-                size = self._estimate_backup_size(assistant_backup)
-                total_size += size
+        results = await asyncio.gather(
+            *(backup_bounded(assistant_name) for assistant_name in assistant_names),
+            return_exceptions=True
+        )
 
-            except Exception as e:
-                raise VAPIException(f"Failed to backup assistant '{assistant_name}': {str(e)}")
+        backup_data = []
+        total_size = 0
+
+        for assistant_name, assistant_backup in zip(assistant_names, results):
+            if isinstance(assistant_backup, Exception):
+                raise VAPIException(f"Failed to backup assistant '{assistant_name}': {str(assistant_backup)}")
+
+            backup_data.append(assistant_backup)
+
+            # Calculate size (rough estimate)
+            total_size += self._estimate_backup_size(assistant_backup)
 
         # Create metadata
         metadata = BackupMetadata(
             backup_id=backup_id,
-            created_at=datetime.now(timezone.utc),
+            created_at=created_at,
             created_by=self._get_current_user(),
             backup_type=backup_type,
             backup_scope=backup_scope,
@@ -116,10 +253,17 @@ class BackupManager:
         # Calculate and set checksum
         manifest.checksum = manifest.calculate_checksum()
 
-        # Save backup to file
-        backup_file = self.backups_dir / f"{backup_id}.json"
-        with open(backup_file, 'w', encoding='utf-8') as f:
-            json.dump(manifest.to_dict(), f, indent=2, default=self._json_serializer)
+        # Save backup to file, compressed with zstd (or gzip without zstandard) if requested
+        payload = self._serialize_manifest(manifest.to_dict())
+        if not self.compress:
+            backup_file = self.backups_dir / f"{backup_id}.json"
+        elif zstandard is not None:
+            backup_file = self.backups_dir / f"{backup_id}.json.zst"
+            payload = zstandard.ZstdCompressor(level=3, threads=-1).compress(payload)
+        else:
+            backup_file = self.backups_dir / f"{backup_id}.json.gz"
+            payload = gzip.compress(payload)
+        backup_file.write_bytes(payload)
 
         metadata.status = BackupStatus.VALIDATED
         return manifest
@@ -139,7 +283,7 @@ class BackupManager:
                 if self.deployment_manager.is_deployed(assistant_name, environment):
                     deployment_info = self.deployment_manager.get_deployment_info(assistant_name, environment)
                     assistant = await self.assistant_service.get_assistant(deployment_info.id)
-                    backup_data.vapi_data = json.loads(json.dumps(assistant.model_dump(by_alias=True), default=self._json_serializer))
+                    backup_data.vapi_data = assistant.model_dump(mode='json', by_alias=True)
             except Exception as e:
                 # VAPI data not available, but continue with local backup
                 backup_data.vapi_data = None
@@ -184,15 +328,45 @@ class BackupManager:
             return file_contents
 
         # Recursively backup all files
-        for file_path in assistant_path.rglob('*'):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(assistant_path)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_contents[str(relative_path)] = f.read()
-                except (UnicodeDecodeError, OSError):
-                    # Skip binary files or files that can't be read
-                    continue
+        files = [
+            file_path for file_path in assistant_path.rglob('*')
+            if file_path.suffix.lower() not in _BINARY_SUFFIXES and file_path.is_file()
+        ]
+
+        def read_text(file_path: Path) -> Tuple[str, Optional[str]]:
+            relative_path = str(file_path.relative_to(assistant_path))
+            try:
+                with open(file_path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size == 0:
+                        return relative_path, ''
+                    if size > _MAX_BACKUP_FILE_BYTES:
+                        return relative_path, None
+                    # Sniff the start for NUL bytes before reading the rest
+                    head = f.read(_BINARY_SNIFF_BYTES)
+                    if b'\0' in head:
+                        return relative_path, None
+                    raw = head + f.read()
+                content = raw.decode('utf-8')
+            except (UnicodeDecodeError, OSError):
+                # Skip binary files or files that can't be read
+                return relative_path, None
+
+            # Match text-mode reading, which normalizes line endings
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return relative_path, content
+
+        # Overlap the reads once there are enough files to make it worthwhile
+        if len(files) >= 4:
+            with ThreadPoolExecutor(max_workers=min(16, len(files))) as executor:
+                results = list(executor.map(read_text, files))
+        else:
+            results = [read_text(file_path) for file_path in files]
+
+        for relative_path, content in results:
+            if content is not None:
+                file_contents[relative_path] = content
 
         return file_contents
 
@@ -244,17 +418,34 @@ class BackupManager:
                     result.add_warning(f"Failed to create safety backup: {str(e)}")
 
             # Restore each assistant
-            for assistant_backup in manifest.assistants:
-                try:
-                    if options.dry_run:
-                        result.mark_restored(assistant_backup.assistant_name)
-                        continue
-
-                    await self._restore_single_assistant(assistant_backup, options, result)
+            if options.dry_run:
+                for assistant_backup in manifest.assistants:
+                    result.mark_restored(assistant_backup.assistant_name)
+            else:
+                # Restore concurrently; each assistant records into its own result,
+                # merged afterwards in manifest order
+                semaphore = asyncio.Semaphore(8)
+
+                async def restore_bounded(assistant_backup: AssistantBackupData) -> RestoreResult:
+                    assistant_result = RestoreResult(success=False)
+                    async with semaphore:
+                        try:
+                            await self._restore_single_assistant(assistant_backup, options, assistant_result)
+                        except Exception as e:
+                            assistant_result.mark_failed(assistant_backup.assistant_name)
+                            assistant_result.add_error(f"Failed to restore {assistant_backup.assistant_name}: {str(e)}")
+                    return assistant_result
+
+                assistant_results = await asyncio.gather(
+                    *(restore_bounded(assistant_backup) for assistant_backup in manifest.assistants)
+                )
 
-                except Exception as e:
-                    result.mark_failed(assistant_backup.assistant_name)
-                    result.add_error(f"Failed to restore {assistant_backup.assistant_name}: {str(e)}")
+                for assistant_result in assistant_results:
+                    result.restored_assistants.extend(assistant_result.restored_assistants)
+                    result.skipped_assistants.extend(assistant_result.skipped_assistants)
+                    result.failed_assistants.extend(assistant_result.failed_assistants)
+                    result.errors.extend(assistant_result.errors)
+                    result.warnings.extend(assistant_result.warnings)
 
             # Determine overall success
             result.success = len(result.failed_assistants) == 0
@@ -311,14 +502,19 @@ class BackupManager:
         if options.create_missing_directories:
             assistant_path.mkdir(parents=True, exist_ok=True)
 
-        # Restore file contents
+        # Restore file contents off the event loop
         if backup_data.file_contents:
-            for relative_path, content in backup_data.file_contents.items():
-                file_path = assistant_path / relative_path
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_files_sync, assistant_path, backup_data.file_contents)
+
+    def _write_files_sync(self, assistant_path: Path, file_contents: Dict[str, str]):
+        """Write backed-up files below an assistant directory."""
+        for relative_path, content in file_contents.items():
+            file_path = assistant_path / relative_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
 
     async def _restore_vapi_data(
         self,
@@ -369,10 +565,12 @@ class BackupManager:
         """List all available backups."""
         backups = []
 
-        for backup_file in self.backups_dir.glob("*.json"):
+        with os.scandir(self.backups_dir) as it:
+            entries = [entry for entry in it if entry.name.endswith(_BACKUP_SUFFIXES) and entry.is_file()]
+
+        for entry in entries:
             try:
-                manifest = self._load_backup_manifest(str(backup_file))
-                backups.append(manifest.metadata)
+                backups.append(self._load_backup_metadata(entry.path, entry.stat()))
             except:
                 # Skip corrupted backup files
                 continue
@@ -380,28 +578,116 @@ class BackupManager:
         # Sort by creation date (newest first)
         return sorted(backups, key=lambda b: b.created_at, reverse=True)
 
+    def get_backup_path(self, backup_id: str) -> Optional[Path]:
+        """Get the file holding a backup, whichever format it was written in."""
+        for suffix in _BACKUP_SUFFIXES:
+            backup_file = self.backups_dir / f"{backup_id}{suffix}"
+            if backup_file.exists():
+                return backup_file
+        return None
+
+    def scan_backup_files(self) -> Dict[str, os.DirEntry]:
+        """Map backup IDs to their files with a single directory read.
+
+        When a backup exists in several formats, the entry returned is the
+        one get_backup_path would pick.
+        """
+        candidates: Dict[str, Tuple[int, os.DirEntry]] = {}
+        with os.scandir(self.backups_dir) as it:
+            for entry in it:
+                for rank, suffix in enumerate(_BACKUP_SUFFIXES):
+                    if entry.name.endswith(suffix):
+                        backup_id = entry.name[:-len(suffix)]
+                        current = candidates.get(backup_id)
+                        if (current is None or rank < current[0]) and entry.is_file():
+                            candidates[backup_id] = (rank, entry)
+                        break
+        return {backup_id: entry for backup_id, (_, entry) in candidates.items()}
+
     def get_backup_details(self, backup_id: str) -> Optional[BackupManifest]:
         """Get detailed information about a specific backup."""
-        backup_file = self.backups_dir / f"{backup_id}.json"
-        if not backup_file.exists():
+        backup_file = self.get_backup_path(backup_id)
+        if backup_file is None:
             return None
 
         return self._load_backup_manifest(str(backup_file))
 
     def delete_backup(self, backup_id: str) -> bool:
         """Delete a backup file."""
-        backup_file = self.backups_dir / f"{backup_id}.json"
-        if backup_file.exists():
+        backup_file = self.get_backup_path(backup_id)
+        if backup_file is not None:
             backup_file.unlink()
+            self._metadata_cache.pop(str(backup_file), None)
             return True
         return False
 
     def _load_backup_manifest(self, backup_path: str) -> BackupManifest:
         """Load backup manifest from file."""
-        with open(backup_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open_backup_file(backup_path) as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return BackupManifest.from_dict(data)
 
+    def _load_backup_metadata(self, backup_path: str, stat_result: os.stat_result) -> BackupMetadata:
+        """Load only the metadata of a backup, falling back to a full parse."""
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        cached = self._metadata_cache.get(backup_path)
+        if cached is not None and cached[0] == signature:
+            self._metadata_cache.move_to_end(backup_path)
+            # Callers get their own copy so the cached entry cannot be mutated
+            return copy.deepcopy(cached[1])
+
+        header = self.read_manifest_header(backup_path)
+        if header and isinstance(header.get('metadata'), dict):
+            metadata = BackupMetadata.from_dict(header['metadata'])
+        else:
+            metadata = self._load_backup_manifest(backup_path).metadata
+        self._metadata_cache[backup_path] = (signature, metadata)
+        if len(self._metadata_cache) > _METADATA_CACHE_SIZE:
+            self._metadata_cache.popitem(last=False)
+        return copy.deepcopy(metadata)
+
+    @staticmethod
+    def read_manifest_header(backup_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Decode the top-level manifest entries that precede "assistants".
+
+        Only as much of the file as those entries need is read. Older
+        manifests keep the checksum after the assistants, so for them the
+        header holds the metadata alone.
+
+        Returns:
+            Dictionary of the leading entries, or None if the file does not
+            start like an assistant backup manifest (for example a squad backup)
+        """
+        decoder = json.JSONDecoder()
+        with open_backup_file(backup_path) as f:
+            chunk = f.read(_HEADER_READ_CHUNK)
+            while True:
+                # The tail may end mid-character; only the decoded prefix matters
+                parsed = _parse_manifest_header(decoder, chunk.decode('utf-8', errors='replace'))
+                if parsed is not None:
+                    header, stop_key = parsed
+                    return header if stop_key == 'assistants' else None
+                more = f.read(len(chunk))
+                if not more:
+                    return None
+                chunk += more
+
+    def _serialize_manifest(self, data: Dict[str, Any]) -> bytes:
+        """Encode manifest data as indented JSON, using orjson when it is installed."""
+        if orjson is not None:
+            return orjson.dumps(
+                data,
+                default=self._json_serializer,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        # Write non-ASCII text as UTF-8 rather than \u escapes, matching orjson's output
+        return json.dumps(
+            data, indent=2, ensure_ascii=False, default=self._json_serializer
+        ).encode('utf-8')
+
     def _get_all_assistant_names(self) -> List[str]:
         """Get list of all assistant names."""
         if not self.assistants_dir.exists():
@@ -417,13 +703,11 @@ class BackupManager:
 
     def _estimate_backup_size(self, backup_data: AssistantBackupData) -> int:
         """Estimate backup size in bytes."""
-        import sys
-
         size = 0
         if backup_data.vapi_data:
-            size += sys.getsizeof(json.dumps(backup_data.vapi_data))
+            size += _estimate_json_size(backup_data.vapi_data)
         if backup_data.local_config:
-            size += sys.getsizeof(json.dumps(backup_data.local_config))
+            size += _estimate_json_size(backup_data.local_config)
         if backup_data.file_contents:
             size += sum(len(content.encode('utf-8')) for content in backup_data.file_contents.values())
 
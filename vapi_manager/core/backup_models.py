@@ -6,6 +6,8 @@ including both local configurations and deployed VAPI data.
 """
 
 import json
+import hashlib
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
@@ -15,6 +17,17 @@ from pydantic import BaseModel, Field, ConfigDict
 
 from ..core.models.assistant import Assistant
 
+# File contents shorter than this are always stored inline; a blob reference
+# would not be meaningfully smaller
+_MIN_SHARED_BLOB_CHARS = 64
+
+# Manifests with every file content inline are written as 1.0; manifests that
+# store repeated contents under 'blobs' are written as 1.1 so older readers,
+# which would treat blob references as file contents, reject them
+_INLINE_FORMAT_VERSION = "1.0"
+_BLOB_FORMAT_VERSION = "1.1"
+_SUPPORTED_FORMAT_VERSIONS = frozenset({_INLINE_FORMAT_VERSION, _BLOB_FORMAT_VERSION})
+
 
 class BackupType(str, Enum):
     """Type of backup."""
@@ -128,7 +141,7 @@ class BackupManifest(BaseModel):
 
     metadata: BackupMetadata
     assistants: List[AssistantBackupData]
-    backup_format_version: str = "1.0"
+    backup_format_version: str = _INLINE_FORMAT_VERSION
     checksum: Optional[str] = None
 
     def calculate_checksum(self) -> str:
@@ -141,14 +154,24 @@ class BackupManifest(BaseModel):
                 return obj.isoformat()
             return str(obj)
 
-        # Create a deterministic string representation
-        data_str = json.dumps({
-            'metadata': self.metadata.to_dict(),
-            'assistants': [a.to_dict() for a in self.assistants],
-            'backup_format_version': self.backup_format_version
-        }, sort_keys=True, default=json_serializer)
+        # Hash the deterministic representation piece by piece, one assistant at a
+        # time. The bytes fed in are exactly json.dumps(sort_keys=True) of
+        # {'assistants': [...], 'backup_format_version': ..., 'metadata': ...}
+        encode = json.JSONEncoder(sort_keys=True, default=json_serializer).encode
+        digest = hashlib.sha256(b'{"assistants": [')
+
+        for i, assistant in enumerate(self.assistants):
+            if i:
+                digest.update(b', ')
+            digest.update(encode(assistant.to_dict()).encode())
 
-        return hashlib.sha256(data_str.encode()).hexdigest()
+        digest.update(b'], "backup_format_version": ')
+        digest.update(encode(self.backup_format_version).encode())
+        digest.update(b', "metadata": ')
+        digest.update(encode(self.metadata.to_dict()).encode())
+        digest.update(b'}')
+
+        return digest.hexdigest()
 
     def validate_integrity(self) -> bool:
         """Validate backup integrity using checksum."""
@@ -157,24 +180,96 @@ class BackupManifest(BaseModel):
         return self.calculate_checksum() == self.checksum
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        """Convert to dictionary for serialization.
+
+        File contents that appear more than once across assistants are stored
+        once under 'blobs' and referenced as {"blob": <key>}, and the manifest
+        is then written as format 1.1. The checksum is computed over the
+        inline 1.0 form, so it is unaffected.
+        """
+        assistants = [a.to_dict() for a in self.assistants]
+        blobs = self._share_file_contents(assistants)
+
+        # Everything except the assistants goes first, so readers that only need
+        # the header can stop before the payload
+        data = {
             'metadata': self.metadata.to_dict(),
-            'assistants': [a.to_dict() for a in self.assistants],
-            'backup_format_version': self.backup_format_version,
-            'checksum': self.checksum
+            'backup_format_version': _BLOB_FORMAT_VERSION if blobs else self.backup_format_version,
+            'checksum': self.checksum,
+            'assistants': assistants
         }
+        if blobs:
+            data['blobs'] = blobs
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BackupManifest':
-        """Create from dictionary."""
+        """Create from dictionary.
+
+        Raises:
+            ValueError: If the manifest was written in an unknown format version
+        """
+        version = data.get('backup_format_version', _INLINE_FORMAT_VERSION)
+        if version not in _SUPPORTED_FORMAT_VERSIONS:
+            raise ValueError(f"Unsupported backup format version: {version}")
+
+        assistants = data['assistants']
+        blobs = data.get('blobs')
+        if blobs:
+            assistants = [cls._resolve_file_contents(a, blobs) for a in assistants]
+
         return cls(
             metadata=BackupMetadata.from_dict(data['metadata']),
-            assistants=[AssistantBackupData.from_dict(a) for a in data['assistants']],
-            backup_format_version=data.get('backup_format_version', '1.0'),
+            assistants=[AssistantBackupData.from_dict(a) for a in assistants],
+            # Blob references are inlined above, so the manifest is back in the
+            # 1.0 form its checksum was computed over
+            backup_format_version=_INLINE_FORMAT_VERSION if version == _BLOB_FORMAT_VERSION else version,
             checksum=data.get('checksum')
         )
 
+    @staticmethod
+    def _share_file_contents(assistants: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Replace repeated file contents in serialized assistants with blob references."""
+        counts = Counter(
+            content
+            for assistant in assistants if assistant['file_contents']
+            for content in assistant['file_contents'].values()
+            if len(content) >= _MIN_SHARED_BLOB_CHARS
+        )
+        shared = {content: None for content, count in counts.items() if count > 1}
+        if not shared:
+            return {}
+
+        blobs = {}
+        for content in shared:
+            key = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            shared[content] = key
+            blobs[key] = content
+
+        for assistant in assistants:
+            file_contents = assistant['file_contents']
+            if file_contents:
+                # Build a new dict; the original belongs to the AssistantBackupData
+                assistant['file_contents'] = {
+                    path: {'blob': shared[content]} if content in shared else content
+                    for path, content in file_contents.items()
+                }
+        return blobs
+
+    @staticmethod
+    def _resolve_file_contents(assistant: Dict[str, Any], blobs: Dict[str, str]) -> Dict[str, Any]:
+        """Return a copy of a serialized assistant with blob references inlined."""
+        file_contents = assistant.get('file_contents')
+        if not file_contents:
+            return assistant
+        return {
+            **assistant,
+            'file_contents': {
+                path: blobs[content['blob']] if isinstance(content, dict) else content
+                for path, content in file_contents.items()
+            }
+        }
+
 
 @dataclass
 class RestoreOptions:
@@ -5,15 +5,57 @@ This module provides utility functions for backup operations including
 validation, cleanup, compression, and backup organization.
 """
 
+import os
+import re
 import json
+import mmap
 import gzip
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from ..core.backup_models import BackupMetadata, BackupManifest, BackupStatus
-from ..core.backup_manager import BackupManager
+from ..core.backup_manager import BackupManager, open_backup_file
+
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Below this many backups, validating in-process beats starting worker processes
+_PARALLEL_VALIDATION_MIN = 4
+
+# Validation results persisted in the backups directory, keyed by backup ID
+# and reused while the file's name, mtime and size are unchanged. The name
+# must not end in a backup suffix, or list_backups would try to load it.
+_VALIDATION_CACHE_FILE = '.validation_cache'
+
+_CHECKSUM_RE = re.compile(r'[0-9a-f]{64}')
+
+
+def _load_backup_data(backup_path) -> Dict[str, Any]:
+    """Read and parse a backup file, using orjson when it is installed."""
+    if orjson is not None and str(backup_path).endswith('.json'):
+        # orjson parses straight from the mapped pages, without copying the
+        # file into a bytes object first (mmap cannot map an empty file)
+        with open(backup_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+
+    with open_backup_file(backup_path) as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 class BackupUtils:
@@ -35,8 +77,7 @@ class BackupUtils:
 
         try:
             # Load and parse JSON
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_backup_data(backup_file)
 
             # Validate required fields
             if 'metadata' not in data:
@@ -72,20 +113,71 @@ class BackupUtils:
         except Exception as e:
             return False, [f"Validation error: {str(e)}"]
 
+    @staticmethod
+    def quick_validate_backup_file(backup_path: str) -> Tuple[bool, List[str]]:
+        """
+        Check a backup file's header without parsing or hashing its assistants.
+
+        Verifies that the file is non-empty, that its metadata decodes and that
+        it carries a well-formed checksum. Manifests written before the header
+        was moved ahead of the assistants get the full validate_backup_file.
+
+        Returns:
+            Tuple of (is_valid, errors)
+        """
+        errors = []
+        backup_file = Path(backup_path)
+
+        if not backup_file.exists():
+            return False, ["Backup file does not exist"]
+        if backup_file.stat().st_size == 0:
+            return False, ["Backup file is empty"]
+
+        try:
+            header = BackupManager.read_manifest_header(str(backup_file))
+        except Exception as e:
+            return False, [f"Validation error: {str(e)}"]
+
+        if header is None or 'checksum' not in header:
+            return BackupUtils.validate_backup_file(backup_path)
+
+        if 'metadata' not in header:
+            errors.append("Missing metadata section")
+        else:
+            try:
+                BackupMetadata.from_dict(header['metadata'])
+            except Exception as e:
+                errors.append(f"Invalid metadata: {str(e)}")
+
+        if 'backup_format_version' not in header:
+            errors.append("Missing backup_format_version")
+
+        checksum = header['checksum']
+        if not isinstance(checksum, str) or not _CHECKSUM_RE.fullmatch(checksum):
+            errors.append("Missing or malformed checksum")
+
+        return len(errors) == 0, errors
+
     @staticmethod
     def compress_backup(backup_path: str, remove_original: bool = True) -> str:
         """
-        Compress a backup file using gzip.
+        Compress a backup file using zstd, or gzip if zstandard is not installed.
 
         Returns:
             Path to compressed backup file
         """
         backup_file = Path(backup_path)
-        compressed_path = backup_file.with_suffix(backup_file.suffix + '.gz')
 
-        with open(backup_file, 'rb') as f_in:
-            with gzip.open(compressed_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+        if zstandard is not None:
+            compressed_path = backup_file.with_suffix(backup_file.suffix + '.zst')
+            with open(backup_file, 'rb') as f_in:
+                with open(compressed_path, 'wb') as f_out:
+                    zstandard.ZstdCompressor(level=3, threads=-1).copy_stream(f_in, f_out)
+        else:
+            compressed_path = backup_file.with_suffix(backup_file.suffix + '.gz')
+            with open(backup_file, 'rb') as f_in:
+                with gzip.open(compressed_path, 'wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out)
 
         if remove_original:
             backup_file.unlink()
@@ -95,7 +187,7 @@ class BackupUtils:
     @staticmethod
     def decompress_backup(compressed_path: str, output_path: Optional[str] = None) -> str:
         """
-        Decompress a gzipped backup file.
+        Decompress a zstd or gzip compressed backup file.
 
         Returns:
             Path to decompressed backup file
@@ -105,12 +197,23 @@ class BackupUtils:
         if output_path:
             output_file = Path(output_path)
         else:
-            # Remove .gz extension
+            # Remove .zst/.gz extension
             output_file = compressed_file.with_suffix('')
 
-        with gzip.open(compressed_file, 'rb') as f_in:
-            with open(output_file, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+        # Detect the format from its magic bytes so legacy .gz backups still work
+        with open(compressed_file, 'rb') as f_in:
+            is_zstd = f_in.read(4) == _ZSTD_MAGIC
+
+        if is_zstd:
+            if zstandard is None:
+                raise RuntimeError(f"Decompressing {compressed_file} requires the 'zstandard' package")
+            with open(compressed_file, 'rb') as f_in:
+                with open(output_file, 'wb') as f_out:
+                    zstandard.ZstdDecompressor().copy_stream(f_in, f_out)
+        else:
+            with gzip.open(compressed_file, 'rb') as f_in:
+                with open(output_file, 'wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out)
 
         return str(output_file)
 
@@ -142,7 +245,8 @@ class BackupUtils:
                     deleted_backups.append(backup.backup_id)
 
         # If still too many backups, delete oldest ones
-        remaining_backups = [b for b in backups if b.backup_id not in deleted_backups]
+        deleted_ids = set(deleted_backups)
+        remaining_backups = [b for b in backups if b.backup_id not in deleted_ids]
         if len(remaining_backups) > max_backups:
             backups_to_delete = remaining_backups[:-max_backups]
             for backup in backups_to_delete:
@@ -160,8 +264,7 @@ class BackupUtils:
             True if successful
         """
         try:
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_backup_data(backup_path)
 
             manifest_data = {
                 'metadata': data['metadata'],
@@ -169,8 +272,12 @@ class BackupUtils:
                 'assistant_names': [a['assistant_name'] for a in data.get('assistants', [])]
             }
 
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest_data, f, indent=2, default=str)
+            if orjson is not None:
+                payload = orjson.dumps(manifest_data, default=str, option=orjson.OPT_INDENT_2)
+                Path(export_path).write_bytes(payload)
+            else:
+                with open(export_path, 'w', encoding='utf-8') as f:
+                    json.dump(manifest_data, f, indent=2, default=str)
 
             return True
 
@@ -194,10 +301,8 @@ class BackupUtils:
 
         try:
             # Load both backups
-            with open(backup_path1, 'r', encoding='utf-8') as f:
-                data1 = json.load(f)
-            with open(backup_path2, 'r', encoding='utf-8') as f:
-                data2 = json.load(f)
+            data1 = _load_backup_data(backup_path1)
+            data2 = _load_backup_data(backup_path2)
 
             # Get assistant names from both backups
             assistants1 = {a['assistant_name'] for a in data1.get('assistants', [])}
@@ -241,19 +346,42 @@ class BackupUtils:
             return "0 B"
 
         size_names = ["B", "KB", "MB", "GB", "TB"]
-        import math
 
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
+        # Each unit is 2**10 times the previous one
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
+        s = round(size_bytes / (1 << (i * 10)), 2)
 
         return f"{s} {size_names[i]}"
 
     @staticmethod
-    def generate_backup_report(backup_manager: BackupManager) -> Dict[str, Any]:
+    def _load_validation_cache(cache_file: Path) -> Dict[str, Any]:
+        """Load cached validation results, treating a missing or broken cache as empty."""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _save_validation_cache(cache_file: Path, cache: Dict[str, Any]):
+        """Persist validation results; failing to write the cache is not an error."""
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+
+    @staticmethod
+    def generate_backup_report(backup_manager: BackupManager, deep: bool = False) -> Dict[str, Any]:
         """
         Generate a comprehensive backup report.
 
+        Args:
+            backup_manager: Backup manager whose backups are reported on
+            deep: Fully parse and verify the checksum of every backup instead
+                of only checking each file's header
+
         Returns:
             Dictionary with backup statistics and health information
         """
@@ -273,17 +401,52 @@ class BackupUtils:
         valid_backups = 0
         corrupted_backups = 0
 
+        cache_file = backup_manager.backups_dir / _VALIDATION_CACHE_FILE
+        cached_results = BackupUtils._load_validation_cache(cache_file)
+        validation_cache = {}
+        checked_ids = []
+        pending = []
+
+        # One directory read resolves every backup's file and its stat
+        backup_files = backup_manager.scan_backup_files()
+
         for backup in backups:
-            backup_file = backup_manager.backups_dir / f"{backup.backup_id}.json"
-            if backup_file.exists():
-                total_size += backup_file.stat().st_size
-
-                # Check backup validity
-                is_valid, _ = BackupUtils.validate_backup_file(str(backup_file))
-                if is_valid:
-                    valid_backups += 1
+            entry = backup_files.get(backup.backup_id)
+            if entry is not None:
+                st = entry.stat()
+                total_size += st.st_size
+                checked_ids.append(backup.backup_id)
+
+                signature = [entry.name, st.st_mtime_ns, st.st_size]
+                # A deep result also answers a quick check, but not the reverse
+                cached = cached_results.get(backup.backup_id)
+                if (cached is not None and cached.get('signature') == signature
+                        and (cached.get('deep') or not deep)):
+                    validation_cache[backup.backup_id] = cached
                 else:
-                    corrupted_backups += 1
+                    pending.append((backup.backup_id, entry.path, signature))
+
+        # Deep validation parses and hashes every backup, so spread it across processes
+        pending_paths = [path for _, path, _ in pending]
+        workers = min(len(pending_paths), os.cpu_count() or 1)
+        if deep and len(pending_paths) >= _PARALLEL_VALIDATION_MIN and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(BackupUtils.validate_backup_file, pending_paths, chunksize=4))
+        else:
+            validate = BackupUtils.validate_backup_file if deep else BackupUtils.quick_validate_backup_file
+            results = [validate(path) for path in pending_paths]
+
+        for (backup_id, _, signature), (is_valid, _) in zip(pending, results):
+            validation_cache[backup_id] = {'signature': signature, 'valid': is_valid, 'deep': deep}
+
+        for backup_id in checked_ids:
+            if validation_cache[backup_id]['valid']:
+                valid_backups += 1
+            else:
+                corrupted_backups += 1
+
+        if validation_cache != cached_results:
+            BackupUtils._save_validation_cache(cache_file, validation_cache)
 
         # Sort by date
         backups.sort(key=lambda b: b.created_at)
@@ -3,12 +3,13 @@ Dependency resolver for squad deployments.
 Handles checking and resolving assistant dependencies before squad creation.
 """
 
-from typing import List, Dict, Set, Optional, Tuple
+import asyncio
+from typing import Callable, List, Dict, Set, Optional, Tuple
 from pathlib import Path
 from rich.console import Console
 
-from ..core.deployment_state import DeploymentStateManager
-from ..core.squad_config import SquadConfigLoader
+from ..core.deployment_state import DeploymentInfo, DeploymentStateManager
+from ..core.squad_config import SquadConfig, SquadConfigLoader
 from ..services.assistant_service import AssistantService
 from ..core.exceptions.vapi_exceptions import VAPIException
 
@@ -39,6 +40,48 @@ class SquadDependencyResolver:
         self.squad_config_loader = SquadConfigLoader(squads_directory)
         self.assistant_service = AssistantService()
 
+        # Squad configurations loaded by this resolver, keyed by (squad, environment)
+        self._squad_cache: Dict[Tuple[str, str], SquadConfig] = {}
+
+        # Assistant config loader shared by every deploy, created on first use
+        self._config_loader = None
+
+    def _get_squad_config(self, squad_name: str, environment: str) -> SquadConfig:
+        """Load a squad configuration once and reuse it for later checks."""
+        key = (squad_name, environment)
+        squad_config = self._squad_cache.get(key)
+        if squad_config is None:
+            squad_config = self._squad_cache[key] = self.squad_config_loader.load_squad(squad_name, environment)
+        return squad_config
+
+    @staticmethod
+    def _member_assistant_names(squad_config: SquadConfig) -> List[str]:
+        """Return the assistant names of a squad's members, in member order."""
+        return [
+            member['assistant_name'] for member in squad_config.members
+            if member.get('assistant_name')
+        ]
+
+    async def _get_deployment_infos(self, assistant_names: List[str], environment: str) -> Dict[str, DeploymentInfo]:
+        """Read the members' deployment state off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.deployment_state_manager.get_deployment_infos, assistant_names, environment
+        )
+
+    def invalidate(self, squad_name: Optional[str] = None):
+        """
+        Forget cached squad configurations.
+
+        Args:
+            squad_name: Squad to forget; all squads are forgotten when omitted
+        """
+        if squad_name is None:
+            self._squad_cache.clear()
+        else:
+            for key in [key for key in self._squad_cache if key[0] == squad_name]:
+                del self._squad_cache[key]
+
     async def check_missing_assistants(
         self,
         squad_name: str,
@@ -54,27 +97,18 @@ class SquadDependencyResolver:
         Returns:
             List of assistant names that are not deployed
         """
-        missing_assistants = []
-
         try:
             # Load squad configuration
-            squad_config = self.squad_config_loader.load_squad(squad_name, environment)
+            squad_config = self._get_squad_config(squad_name, environment)
 
-            # Check each member assistant
-            for member in squad_config.members:
-                assistant_name = member.get('assistant_name')
-                if not assistant_name:
-                    continue
-
-                # Check if assistant is deployed
-                deployment_info = self.deployment_state_manager.get_deployment_info(
-                    assistant_name, environment
-                )
+            # Look up every member's deployment state in one batch
+            assistant_names = self._member_assistant_names(squad_config)
+            deployment_infos = await self._get_deployment_infos(assistant_names, environment)
 
-                if not deployment_info.is_deployed():
-                    missing_assistants.append(assistant_name)
-
-            return missing_assistants
+            return [
+                assistant_name for assistant_name in assistant_names
+                if not deployment_infos[assistant_name].is_deployed()
+            ]
 
         except Exception as e:
             raise VAPIException(f"Error checking assistant dependencies: {str(e)}")
@@ -94,26 +128,19 @@ class SquadDependencyResolver:
         Returns:
             Dictionary mapping assistant names to deployment status
         """
-        status = {}
-
         try:
             # Load squad configuration
-            squad_config = self.squad_config_loader.load_squad(squad_name, environment)
-
-            # Check each member assistant
-            for member in squad_config.members:
-                assistant_name = member.get('assistant_name')
-                if not assistant_name:
-                    continue
-
-                # Check if assistant is deployed
-                deployment_info = self.deployment_state_manager.get_deployment_info(
-                    assistant_name, environment
-                )
+            squad_config = self._get_squad_config(squad_name, environment)
 
-                status[assistant_name] = deployment_info.is_deployed()
+            # Look up every member's deployment state in one batch
+            deployment_infos = await self._get_deployment_infos(
+                self._member_assistant_names(squad_config), environment
+            )
 
-            return status
+            return {
+                assistant_name: deployment_info.is_deployed()
+                for assistant_name, deployment_info in deployment_infos.items()
+            }
 
         except Exception as e:
             raise VAPIException(f"Error getting dependency status: {str(e)}")
@@ -121,7 +148,8 @@ class SquadDependencyResolver:
     async def deploy_assistant(
         self,
         assistant_name: str,
-        environment: str = "development"
+        environment: str = "development",
+        log: Optional[Callable[[str], None]] = None
     ) -> Optional[str]:
         """
         Deploy a single assistant to VAPI.
@@ -129,26 +157,32 @@ class SquadDependencyResolver:
         Args:
             assistant_name: Name of the assistant to deploy
             environment: Target environment
+            log: Receives each output line instead of the console
 
         Returns:
             Assistant ID if successful, None otherwise
         """
         from vapi_manager.core.assistant_config import AssistantConfigLoader, AssistantBuilder
 
+        log = log or console.print
+
         try:
             # Check if assistant directory exists
             assistant_path = self.assistants_directory / assistant_name
             if not assistant_path.exists():
-                console.print(f"[red]Assistant configuration not found: {assistant_path}[/red]")
+                log(f"[red]Assistant configuration not found: {assistant_path}[/red]")
                 return None
 
-            # Load assistant configuration
-            config_loader = AssistantConfigLoader(str(self.assistants_directory))
+            # Load assistant configuration; one loader serves every deploy so
+            # shared tool files referenced by several assistants are parsed once
+            if self._config_loader is None:
+                self._config_loader = AssistantConfigLoader(str(self.assistants_directory))
+            config_loader = self._config_loader
             assistant_config = config_loader.load_assistant(assistant_name, environment)
 
             # Validate configuration
             config_loader.validate_config(assistant_config)
-            console.print("[green]Configuration validated successfully[/green]")
+            log("[green]Configuration validated successfully[/green]")
 
             # Build assistant request
             assistant_request = AssistantBuilder.build_from_config(assistant_config)
@@ -165,27 +199,28 @@ class SquadDependencyResolver:
                     1  # Version defaults to 1 for new deployments
                 )
 
-                console.print(f"[green]+ Assistant created successfully![/green]")
-                console.print(f"[cyan]Assistant ID:[/cyan] {assistant.id}")
-                console.print(f"[cyan]Name:[/cyan] {assistant.name}")
-                console.print(f"[cyan]Environment:[/cyan] {environment}")
-                console.print(f"[cyan]Version:[/cyan] 1")
-                console.print(f"[cyan]Deployed at:[/cyan] {assistant.created_at}")
+                log(f"[green]+ Assistant created successfully![/green]")
+                log(f"[cyan]Assistant ID:[/cyan] {assistant.id}")
+                log(f"[cyan]Name:[/cyan] {assistant.name}")
+                log(f"[cyan]Environment:[/cyan] {environment}")
+                log(f"[cyan]Version:[/cyan] 1")
+                log(f"[cyan]Deployed at:[/cyan] {assistant.created_at}")
 
                 return assistant.id
             else:
-                console.print(f"[red]Failed to create assistant '{assistant_name}'[/red]")
+                log(f"[red]Failed to create assistant '{assistant_name}'[/red]")
                 return None
 
         except Exception as e:
-            console.print(f"[red]Error deploying assistant '{assistant_name}': {str(e)}[/red]")
+            log(f"[red]Error deploying assistant '{assistant_name}': {str(e)}[/red]")
             return None
 
     async def deploy_missing_assistants(
         self,
         squad_name: str,
         environment: str = "development",
-        force: bool = False
+        force: bool = False,
+        max_concurrency: int = 5
     ) -> Tuple[List[str], List[str]]:
         """
         Deploy all missing assistants for a squad.
@@ -194,6 +229,7 @@ class SquadDependencyResolver:
             squad_name: Name of the squad
             environment: Target environment
             force: Deploy without confirmation
+            max_concurrency: Maximum number of assistants deployed at the same time
 
         Returns:
             Tuple of (successfully deployed assistants, failed assistants)
@@ -204,9 +240,10 @@ class SquadDependencyResolver:
             console.print(f"[green]All assistants are already deployed for squad '{squad_name}'[/green]")
             return [], []
 
-        console.print(f"[yellow]Found {len(missing_assistants)} missing assistant(s):[/yellow]")
-        for assistant in missing_assistants:
-            console.print(f"  - {assistant}")
+        console.print("\n".join(
+            [f"[yellow]Found {len(missing_assistants)} missing assistant(s):[/yellow]"]
+            + [f"  - {assistant}" for assistant in missing_assistants]
+        ))
 
         # Confirm deployment unless force is used
         if not force:
@@ -221,25 +258,40 @@ class SquadDependencyResolver:
         successfully_deployed = []
         failed_deployments = []
 
-        for assistant_name in missing_assistants:
-            console.print(f"\n[cyan]Deploying assistant: {assistant_name}...[/cyan]")
-            assistant_id = await self.deploy_assistant(assistant_name, environment)
+        # Assistants are independent, so deploy them concurrently with a bound
+        # on in-flight API calls; results are collected in the original order.
+        # Each deploy buffers its output and prints it as one block when it
+        # finishes, so lines from different assistants never interleave.
+        semaphore = asyncio.Semaphore(max_concurrency)
 
+        async def deploy(assistant_name: str) -> Optional[str]:
+            lines = [f"\n[cyan]Deploying assistant: {assistant_name}...[/cyan]"]
+            try:
+                async with semaphore:
+                    return await self.deploy_assistant(assistant_name, environment, log=lines.append)
+            finally:
+                console.print("\n".join(lines))
+
+        assistant_ids = await asyncio.gather(*(deploy(name) for name in missing_assistants))
+
+        for assistant_name, assistant_id in zip(missing_assistants, assistant_ids):
             if assistant_id:
                 successfully_deployed.append(assistant_name)
             else:
                 failed_deployments.append(assistant_name)
 
-        # Summary
+        # Summary, written to the console in one call
+        summary = []
         if successfully_deployed:
-            console.print(f"\n[green]Successfully deployed {len(successfully_deployed)} assistant(s):[/green]")
-            for assistant in successfully_deployed:
-                console.print(f"  + {assistant}")
+            summary.append(f"\n[green]Successfully deployed {len(successfully_deployed)} assistant(s):[/green]")
+            summary.extend(f"  + {assistant}" for assistant in successfully_deployed)
 
         if failed_deployments:
-            console.print(f"\n[red]Failed to deploy {len(failed_deployments)} assistant(s):[/red]")
-            for assistant in failed_deployments:
-                console.print(f"  - {assistant}")
+            summary.append(f"\n[red]Failed to deploy {len(failed_deployments)} assistant(s):[/red]")
+            summary.extend(f"  - {assistant}" for assistant in failed_deployments)
+
+        if summary:
+            console.print("\n".join(summary))
 
         return successfully_deployed, failed_deployments
 
@@ -303,7 +355,7 @@ class SquadDependencyResolver:
 
         try:
             # Load squad configuration (use development as default to get all members)
-            squad_config = self.squad_config_loader.load_squad(squad_name, "development")
+            squad_config = self._get_squad_config(squad_name, "development")
 
             for member in squad_config.members:
                 assistant_name = member.get('assistant_name')
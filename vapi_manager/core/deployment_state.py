@@ -100,6 +100,24 @@ class DeploymentStateManager:
         env_data = vapi_state.get('environments', {}).get(environment, {})
         return DeploymentInfo.from_dict(env_data)
 
+    def get_deployment_infos(self, assistant_names: List[str], environment: str) -> Dict[str, DeploymentInfo]:
+        """
+        Get deployment info for several assistants in one environment.
+
+        Each assistant's state is read once, even if its name is repeated.
+
+        Args:
+            assistant_names: Names of the assistants to look up
+            environment: Environment to read
+
+        Returns:
+            Dictionary mapping each distinct assistant name to its deployment info
+        """
+        return {
+            assistant_name: self.get_deployment_info(assistant_name, environment)
+            for assistant_name in dict.fromkeys(assistant_names)
+        }
+
     def is_deployed(self, assistant_name: str, environment: str) -> bool:
         """Check if assistant is deployed in the specified environment."""
         try:
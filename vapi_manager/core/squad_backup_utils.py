@@ -360,10 +360,9 @@ class SquadBackupUtils:
             return "0 B"
 
         size_names = ["B", "KB", "MB", "GB", "TB"]
-        import math
 
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
+        # Each unit is 2**10 times the previous one
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
+        s = round(size_bytes / (1 << (i * 10)), 2)
 
         return f"{s} {size_names[i]}"
\ No newline at end of file
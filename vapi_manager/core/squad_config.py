@@ -27,6 +27,8 @@ class SquadConfig:
     members: List[Dict[str, Any]]
     overrides: Dict[str, Any] = None
     routing: Dict[str, Any] = None
+    # Whether members.yaml exists and has a "members" list, even an empty one
+    members_declared: bool = False
 
     def __post_init__(self):
         if self.overrides is None:
@@ -62,6 +64,7 @@ class SquadConfigLoader:
 
         # Load members configuration
         members = self._load_members_file(squad_path / "members.yaml")
+        members_declared = members is not None
 
         # Load optional overrides
         overrides = self._load_overrides(squad_path / "overrides")
@@ -73,9 +76,10 @@ class SquadConfigLoader:
             name=squad_name,
             base_path=squad_path,
             config=config,
-            members=members,
+            members=members or [],
             overrides=overrides,
-            routing=routing
+            routing=routing,
+            members_declared=members_declared
         )
 
     def _load_config_file(self, file_path: Path, environment: str) -> Dict[str, Any]:
@@ -96,15 +100,15 @@ class SquadConfigLoader:
 
         return config
 
-    def _load_members_file(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Load members configuration from YAML file."""
+    def _load_members_file(self, file_path: Path) -> Optional[List[Dict[str, Any]]]:
+        """Load members configuration from YAML file, or None if it declares none."""
         if not file_path.exists():
-            return []
+            return None
 
         with open(file_path, 'r', encoding='utf-8') as f:
             members_config = yaml.safe_load(f) or {}
 
-        return members_config.get("members", [])
+        return members_config.get("members")
 
     def _load_overrides(self, overrides_dir: Path) -> Dict[str, Any]:
         """Load override configurations from the overrides directory."""